@@ -0,0 +1,41 @@
+"""
+Arithmetic on `Int`, `Float` and `Bool` compared to builtin values.
+
+    $ python examples/bench_arithmetic.py
+"""
+
+import timeit
+
+from fp import Int, Float, Bool
+
+N = 100_000
+
+
+def count(x, one, n=N):
+    for _ in range(n):
+        x = x + one * one
+    return x
+
+
+def bench(stmt, values, number=5):
+    return min(timeit.repeat(stmt, number=1, repeat=number, globals=values))
+
+
+cases = [
+    ("add", "a + b"),
+    ("mul", "a * b"),
+    ("neg", "-a"),
+    ("eq", "a == b"),
+]
+
+print(f"{'op':>12} {'builtin':>10} {'fp':>10} {'ratio':>6}")
+for T, (a, b) in [(Int, (3, 4)), (Float, (1.5, 2.0)), (Bool, (1, 0))]:
+    for op, stmt in cases:
+        loop = f"for _ in range({N}): {stmt}"
+        t0 = bench(loop, dict(a=type(a)(a), b=type(b)(b)))
+        t1 = bench(loop, dict(a=T(a), b=T(b)))
+        print(f"{T.__name__ + '.' + op:>12} {t0 * 1e9 / N:>8.0f}ns {t1 * 1e9 / N:>8.0f}ns {t1 / t0:>6.1f}")
+
+t0 = min(timeit.repeat(lambda: count(0, 1), number=1, repeat=5))
+t1 = min(timeit.repeat(lambda: count(Int(0), Int(1)), number=1, repeat=5))
+print(f"{'counter':>12} {t0 * 1e9 / N:>8.0f}ns {t1 * 1e9 / N:>8.0f}ns {t1 / t0:>6.1f}")
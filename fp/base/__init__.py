@@ -2,6 +2,7 @@ from .algebra import Eq, Operad, Monoid, Ring, Alg
 from .num import Bool, Int, Float
 from .str import Str
 from .list import List
+from .stream import Stream
 from .struct import Key, Struct, struct
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     "Int",
     "Float",
     "List",
+    "Stream",
     "Key",
     "Struct",
     "struct",
@@ -3,6 +3,10 @@ import fp.utils as utils
 from fp.cartesian import Type, Hom
 
 
+# builtin outputs boxed by numeric operators, see `Operad.lift_op`
+_numeric = (int, float, bool)
+
+
 class Eq(Type):
 
     def __init__(T, name, bases, dct):
@@ -34,9 +38,30 @@ class Operad(Type):
 
     @staticmethod
     def lift_op(T, op, tgt=None, arity=2):
-        """N-ary operator with output cast to target."""
+        """N-ary operator with output cast to target.
+
+        For types deriving from `int` or `float`, builtin numeric outputs
+        are boxed directly, see :meth:`Operad._box_`.
+        """
         tgt = tgt if tgt else T
-        if arity == 1:
+        box = Operad._box_(tgt)
+        if box is not None and arity == 1:
+
+            def _op_(x):
+                y = op(x)
+                if y.__class__ in _numeric:
+                    return box(y)
+                return y if isinstance(y, tgt) else utils.cast(y, tgt)
+
+        elif box is not None and arity == 2:
+
+            def _op_(x1, x2):
+                y = op(x1, x2)
+                if y.__class__ in _numeric:
+                    return box(y)
+                return y if isinstance(y, tgt) else utils.cast(y, tgt)
+
+        elif arity == 1:
 
             def _op_(x):
                 y = op(x)
@@ -57,6 +82,24 @@ class Operad(Type):
         _op_.__name__ = op.__name__
         return _op_
 
+    @staticmethod
+    def _box_(T):
+        """
+        Cast of builtin numeric values to `T`, if `T` derives from one.
+
+        Returns `T.cast` if defined, or `T` itself if it inherits the
+        constructor of its builtin base. Returns `None` if `T` overrides
+        `__new__`, or has no builtin numeric base.
+        """
+        base = next((b for b in (int, float) if issubclass(T, b)), None)
+        if base is None:
+            return None
+        if "cast" in dir(T):
+            return T.cast
+        if T.__new__ is base.__new__ and type(T).__call__ is type.__call__:
+            return T
+        return None
+
 
 class Monoid(Operad):
     """Monoid type class."""
@@ -83,31 +126,6 @@ class Ring(Monoid):
             eq.__name__ = "eq"
             T.eq = Type.Hom((T, T), cls.Bool)(eq)
 
-    @staticmethod
-    def lift_op(T, op, tgt=None, arity=2):
-        """N-ary operator with output cast to target."""
-        tgt = tgt if tgt else T
-        if arity == 1:
-
-            def _op_(x):
-                y = op(x)
-                return y if isinstance(y, tgt) else utils.cast(y, tgt)
-
-        elif arity == 2:
-
-            def _op_(x1, x2):
-                y = op(x1, x2)
-                return y if isinstance(y, tgt) else utils.cast(y, tgt)
-
-        else:
-
-            def _op_(*xs):
-                y = op(*xs)
-                return y if isinstance(y, tgt) else utils.cast(y, tgt)
-
-        _op_.__name__ = op.__name__
-        return _op_
-
 
 class Alg(Ring):
     """Algebra type class."""
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import itertools
+from array import array
+
 from fp.meta import Type, Monad
-from .num import Int, Monoid
+from .num import Bool, Int, Float, Monoid
 
 import fp.utils as utils
 
@@ -34,10 +37,221 @@ class List(Monoid, metaclass=Monad):
             print(type(xs))
             raise TypeError()
 
+    class Packed(Monad.TopType):
+        """
+        Compact list of numeric values.
+
+        Packed list types `List.packed(A)` derive from this class, for `A`
+        one of `Int`, `Float` or `Bool`. Values are stored unboxed in an
+        `array.array` (8 bytes per `Int` or `Float`, 1 byte per `Bool`)
+        and boxed to `A` on access. `Int` values overflowing 64 bits
+        fall back to a list of boxed values.
+
+        The underlying array is exposed as `xs.data`, and `numpy.asarray(xs)`
+        copies it to a NumPy array.
+
+        **Note:**
+        Packed lists support the mutable sequence methods of lists, but
+        are not `list` instances: they are not JSON serializable, and
+        do not support ordering nor reflected operators, e.g. `[0] + xs`.
+        """
+
+        _typecode_: str
+
+        __hash__ = None
+
+        def __init__(self, xs=()):
+            self._data = self._pack_(xs)
+
+        @classmethod
+        def _pack_(cls, xs) -> array | list:
+            """Cast values to `A` and store them as an array if possible."""
+            A, code = cls._tail_[0], cls._typecode_
+            if isinstance(xs, List.Packed):
+                xs = xs._data
+            elif hasattr(xs, "dtype"):
+                import numpy
+
+                dtype = numpy.dtype(code)
+                if isinstance(xs, numpy.ndarray) and xs.dtype.kind in "biuf":
+                    return array(code, numpy.asarray(xs, dtype=dtype).tobytes())
+            if not hasattr(xs, "__len__"):
+                xs = list(xs)
+            if code != "B":
+                try:
+                    return array(code, xs)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+            try:
+                ys = [utils.cast(x, A) for x in xs]
+            except Exception as e:
+                raise utils.TypeError("input", xs, cls)
+            try:
+                return array(code, ys)
+            except OverflowError:
+                return ys
+
+        def _box_(self, x):
+            A = self._tail_[0]
+            return x if isinstance(x, A) else A(x)
+
+        def _values_(self, xs) -> array | list:
+            """Values of `xs` in the storage format of `self`."""
+            ys = self._pack_(xs)
+            if isinstance(self._data, list):
+                return list(map(self._box_, ys)) if isinstance(ys, array) else ys
+            if isinstance(ys, list):
+                self._data = list(self)
+            return ys
+
+        @property
+        def data(self) -> array | list:
+            return self._data
+
+        def __array__(self, dtype=None, copy=None):
+            import numpy
+
+            if isinstance(self._data, array):
+                xs = numpy.frombuffer(self._data, dtype=self._typecode_).copy()
+            else:
+                xs = numpy.array(self._data)
+            if self._typecode_ == "B":
+                xs = xs.astype(bool)
+            return xs if dtype is None else xs.astype(dtype)
+
+        # --- Sequence methods ---
+
+        def __len__(self):
+            return len(self._data)
+
+        def __iter__(self):
+            return map(self._box_, self._data)
+
+        def __reversed__(self):
+            return map(self._box_, reversed(self._data))
+
+        def __contains__(self, x):
+            return x in self._data
+
+        def __getitem__(self, i):
+            if isinstance(i, slice):
+                return self.__class__(self._data[i])
+            return self._box_(self._data[i])
+
+        def __setitem__(self, i, x):
+            ys = self._values_(x if isinstance(i, slice) else (x,))
+            self._data[i] = ys if isinstance(i, slice) else ys[0]
+
+        def __delitem__(self, i):
+            del self._data[i]
+
+        def __eq__(self, other):
+            if isinstance(other, List.Packed) and type(self._data) is type(other._data):
+                return self._data == other._data
+            if isinstance(other, (list, List.Packed)):
+                return len(self) == len(other) and all(
+                    x == y for x, y in zip(self._data, other)
+                )
+            return NotImplemented
+
+        def __add__(self, other):
+            out = self.copy()
+            out.extend(other)
+            return out
+
+        def __iadd__(self, other):
+            self.extend(other)
+            return self
+
+        def __mul__(self, n: int):
+            return self.__class__(self._data * n)
+
+        def append(self, x):
+            ys = self._values_((x,))
+            self._data.append(ys[0])
+
+        def extend(self, xs):
+            ys = self._values_(xs)
+            self._data.extend(ys)
+
+        def insert(self, i: int, x):
+            ys = self._values_((x,))
+            self._data.insert(i, ys[0])
+
+        def pop(self, i: int = -1):
+            return self._box_(self._data.pop(i))
+
+        def remove(self, x):
+            self._data.remove(x)
+
+        def index(self, x, *args):
+            return self._data.index(x, *args)
+
+        def count(self, x):
+            return self._data.count(x)
+
+        def clear(self):
+            del self._data[:]
+
+        def reverse(self):
+            self._data.reverse()
+
+        def sort(self, key=None, reverse: bool = False):
+            xs = self if key is not None else self._data
+            ys = self._values_(sorted(xs, key=key, reverse=reverse))
+            self._data[:] = ys
+
+        def copy(self):
+            return self.__class__(self)
+
+        def __repr__(self):
+            return "[" + ", ".join([str(x) for x in self]) + "]"
+
+        def __str__(self):
+            return "[" + ", ".join([str(x) for x in self]) + "]"
+
+        @classmethod
+        def cast(cls, xs):
+            if hasattr(xs, "__iter__"):
+                return cls(xs)
+            raise TypeError()
+
+    # array typecodes of packed lists
+    _typecodes_ = {Int: "q", Float: "d", Bool: "B"}
+
+    # packed list types, see `packed`
+    _packed_ = {}
+
     @classmethod
     def new(cls, A):
         return Monoid.__new__(cls, "List A", (cls.Object,), {})
 
+    @classmethod
+    def packed(cls, A) -> type:
+        """
+        Compact list type of `Int`, `Float` or `Bool` values.
+
+        Packed lists store their values in an `array.array`, see
+        :class:`List.Packed`. They are opt-in, as `List(A)` instances
+        are plain lists of boxed values.
+
+        .. code::
+
+            >>> xs = List.packed(Int)(range(3))
+            >>> xs.data
+            array('q', [0, 1, 2])
+        """
+        if A not in cls._typecodes_:
+            raise TypeError(f"Cannot pack values of type {A}")
+        if A not in cls._packed_:
+            dct = {"_typecode_": cls._typecodes_[A]}
+            LA = Monoid.__new__(cls, "List A", (cls.Packed,), dct)
+            LA.__name__ = "Packed " + A.__name__
+            LA._head_ = cls
+            LA._tail_ = (A,)
+            cls._packed_[A] = LA
+        return cls._packed_[A]
+
     @classmethod
     def fmap(cls, f: Hom("A", "B")) -> Hom(cls("A"), cls("B")):
         """
@@ -46,6 +260,8 @@ class List(Monoid, metaclass=Monad):
 
         @Type.Hom(cls(f.src), cls(f.tgt))
         def mapf(xs):
+            if isinstance(f, Type.Hom.Object):
+                return f.map_batch(xs)
             return [f(x) for x in xs]
 
         mapf.__name__ = f"map {f.__name__}"
@@ -57,7 +273,7 @@ class List(Monoid, metaclass=Monad):
         Flatten a list of lists.
         """
         A = xx._tail_[0]._tail_[0]
-        return cls(A)(sum((x for x in xx), []))
+        return cls(A)(itertools.chain.from_iterable(xx))
 
     @classmethod
     def unit(cls, a):
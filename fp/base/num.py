@@ -17,10 +17,10 @@ class Bool(int, metaclass=Ring):
 
     @classmethod
     def cast(cls, x):
-        return Bool(1) if x else Bool(0)
+        return cls._true_ if x else cls._false_
 
     def __neg__(self):
-        return Bool(0 if self else 1)
+        return Bool._false_ if self else Bool._true_
 
     def __bool__(self):
         return super().__eq__(1)
@@ -32,6 +32,9 @@ class Bool(int, metaclass=Ring):
         return "True" if self else "False"
 
 
+Bool._true_, Bool._false_ = Bool(1), Bool(0)
+
+
 class Int(int, metaclass=Ring):
 
     def __str__(self):
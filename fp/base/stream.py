@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import itertools
+from typing import Callable, Iterable, Iterator
+
+from fp.meta import Type, Monad
+from fp.cartesian import Hom
+from .list import List
+
+
+class Stream(Type, metaclass=Monad):
+    """
+    Lazy lists.
+
+    The type `Stream(A)` wraps iterables of values of type `A` without
+    materializing them. Its `fmap`, `bind`, `join` and `filter` operations
+    build a pipeline of generators which is only evaluated on iteration,
+    e.g. by :meth:`collect` to a `List(A)`.
+
+    Streams are created from iterables or from generator functions, which
+    are called on every iteration. One-shot iterators, such as generator
+    objects, are rejected as they could only be traversed once::
+
+        >>> @Stream(Int)
+        ... def naturals():
+        ...     n = 0
+        ...     while True:
+        ...         yield n
+        ...         n += 1
+        ...
+        >>> naturals.filter(lambda n: n % 3 == 0).take(4).collect()
+        List Int : [0, 3, 6, 9]
+
+    Values are not cast to `A`, as `List(A)` would do: streams of typed
+    values are produced by typed arrows, and cast on :meth:`collect`.
+    """
+
+    src = Type
+    tgt = Type
+
+    class Object(Monad.TopType):
+
+        def __init__(self, xs: Iterable | Callable[[], Iterator]):
+            if hasattr(xs, "__iter__"):
+                if iter(xs) is xs:
+                    raise TypeError(
+                        f"{xs} is a one-shot iterator, "
+                        "pass an iterable or a generator function"
+                    )
+                self._iter = lambda: iter(xs)
+            elif callable(xs):
+                self._iter = xs
+            else:
+                raise TypeError(f"{xs} is neither iterable nor callable")
+
+        def __iter__(self):
+            return iter(self._iter())
+
+        def _derive_(self, gen: Callable[[], Iterator], A=None):
+            return self._head_(self._tail_[0] if A is None else A)(gen)
+
+        def filter(self, p: Callable) -> Stream.Object:
+            """Keep values `x` for which `p(x)` is true."""
+            return self._derive_(lambda: filter(p, self))
+
+        def take(self, n: int) -> Stream.Object:
+            """Stop after the first `n` values."""
+            return self._derive_(lambda: itertools.islice(self, n))
+
+        def collect(self) -> List:
+            """Materialize the stream as a `List(A)`."""
+            return List(self._tail_[0])(self)
+
+        def __repr__(self):
+            return f"{self.__class__.__name__} : <lazy>"
+
+        def __str__(self):
+            return "<lazy>"
+
+    @classmethod
+    def new(cls, A):
+        return super().new(A)
+
+    @classmethod
+    def fmap(cls, f: Hom) -> Hom:
+        """
+        Map a function on streams, lazily.
+        """
+
+        @Hom(cls(f.src), cls(f.tgt))
+        def mapf(xs):
+            return xs._derive_(lambda: map(f, xs), f.tgt)
+
+        mapf.__name__ = f"map {f.__name__}"
+        return mapf
+
+    @classmethod
+    def bind(cls, xs, f: Hom):
+        """
+        Concatenate the streams (or iterables) `f(x)` for `x` in `xs`.
+        """
+        B = f.tgt._tail_[0]
+        return xs._derive_(lambda: itertools.chain.from_iterable(map(f, xs)), B)
+
+    @classmethod
+    def join(cls, xx):
+        """
+        Flatten a stream of streams, lazily.
+        """
+        A = xx._tail_[0]._tail_[0]
+        return xx._derive_(lambda: itertools.chain.from_iterable(xx), A)
+
+    @classmethod
+    def unit(cls, a):
+        """
+        Singleton stream.
+        """
+        return cls(type(a))((a,))
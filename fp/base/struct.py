@@ -1,4 +1,5 @@
 from __future__ import annotations
+import keyword
 import typing
 
 from fp.meta import Cofunctor, Var
@@ -55,19 +56,39 @@ class Field:
     def __get__(self, obj, objtype=None):
         if obj is not None:
             return self.slot_descriptor.__get__(obj, objtype)
-        # typed class method
-        src, tgt = objtype, self._value_
-        get = Hom(src, tgt)(lambda obj: self.slot_descriptor.__get__(obj))
-        get.__name__ = "." + self._key_
-        return get
+        # typed class methods
+        if objtype not in self._homs_:
+            self._homs_[objtype] = self._accessors_(objtype)
+        return self._homs_[objtype]
 
     def __set__(self, obj, val):
         self.slot_descriptor.__set__(obj, val)
 
+    @property
+    def _homs_(self) -> dict:
+        if "_homs" not in self.__dict__:
+            self._homs = {}
+        return self._homs
+
+    def _accessors_(self, S: Type) -> Hom.Object:
+        """Typed getter `S -> V`, with `set` and `put` attributes."""
+        V = self._value_
+        get = Hom(S, V)(lambda obj: self.slot_descriptor.__get__(obj))
+        get.__name__ = "." + self._key_
+        put = Hom((V, S), S)(lambda val, obj: self._put_(obj, val))
+        put.__name__ = "put ." + self._key_
+        get.put = put
+        set_ = Hom((V, S), S)(lambda val, obj: self._with_(obj, val))
+        set_.__name__ = "set ." + self._key_
+        get.set = set_
+        return get
+
+    def _put_(self, obj, val):
+        self.__set__(obj, val)
+        return obj
+
     def _with_(self, obj, val):
-        out = obj.copy()
-        self.__set__(out, val)
-        return out
+        return obj.replace(**{self._key_: val})
 
 
 class StructObject(metaclass=Type):
@@ -80,6 +101,9 @@ class StructObject(metaclass=Type):
 
     __slots__ = ()
 
+    # bound on mapped struct types held by `_map_type_`
+    _max_maps_: int = 16
+
     def __init__(self, *xs, **ys):
         """
         Initialize fields.
@@ -138,23 +162,96 @@ class StructObject(metaclass=Type):
             return Struct(keys, values)(*xs)
 
     def map(self, **fs):
-        targets = []
-        ys = []
-        defaults = []
-        for key, (src, *deft) in zip(self._keys_, self._values_):
-            x = getattr(self, key)
+        """
+        Map functions on fields, returning a struct of mapped fields.
+
+        Output field types are read from `(f, tgt)` pairs or `f.tgt`,
+        and inferred from the mapped values otherwise. The output struct
+        type is resolved once per mapping signature, see :meth:`map_batch`
+        for mapping many structs at once.
+        """
+        S = self.__class__
+        keys, ys = [], []
+        for key in self._keys_:
             if key in fs:
-                f = fs[key]
-                if type(f) is tuple:
-                    f, tgt = f
-                else:
-                    tgt = hasattr(f, "tgt") and f.tgt
-                y = f(x)
+                f, tgt = S._map_arrow_(fs[key])
+                y = f(getattr(self, key))
+                keys.append((key, tgt or type(y)))
                 ys.append(y)
-                targets.append(tgt or type(y))
-                defaults.append(deft if tgt is src else ())
-        fields = ((k, Ty, *y) for k, Ty, y in zip(self.__slots__, targets, defaults))
-        return self._head_(*fields)(*ys)
+        return S._map_type_(tuple(keys))(*ys)
+
+    @classmethod
+    def map_batch(S, xs, **fs):
+        """
+        Map functions on fields of a batch of structs.
+
+        The output type is resolved once on the first element, each mapped
+        value is then only cast when it is not already of its field type.
+        Empty batches require output types to be declared, as `(f, tgt)`
+        pairs or typed arrows.
+        """
+        xs = xs if isinstance(xs, List(S)) else List(S)(xs)
+        arrows = [(k, *S._map_arrow_(fs[k])) for k in S._keys_ if k in fs]
+        if not len(xs):
+            if any(tgt is None for _, _, tgt in arrows):
+                raise ValueError(
+                    f"Cannot infer mapped field types of an empty {S} batch."
+                )
+            return List(S._map_type_(tuple((k, tgt) for k, _, tgt in arrows)))([])
+        ys = [[f(getattr(x, k)) for k, f, _ in arrows] for x in xs]
+        keys = tuple((k, tgt or type(y)) for (k, _, tgt), y in zip(arrows, ys[0]))
+        T = S._map_type_(keys)
+        return List(T)([T(*y) for y in ys])
+
+    @classmethod
+    def _map_arrow_(S, f) -> tuple[typing.Callable, Type | None]:
+        """Parse `f` or `(f, tgt)` into a callable and a target type."""
+        if type(f) is tuple:
+            return f
+        return f, getattr(f, "tgt", None)
+
+    @classmethod
+    def _map_type_(S, keys: tuple[tuple[str, Type], ...]) -> Struct:
+        """
+        Struct type of mapped fields, cached on `S` by `(key, type)` pairs.
+
+        Default values are kept on fields with unchanged types.
+        """
+        maps = S.__dict__.get("_maps_")
+        if maps is None:
+            maps = utils.TypeCache(S._mapped_struct_, maxsize=S._max_maps_)
+            S._maps_ = maps
+        return maps(keys)
+
+    @classmethod
+    def _mapped_struct_(S, keys: tuple[tuple[str, Type], ...]) -> Struct:
+        values = dict(zip(S._keys_, S._values_))
+        tgts = []
+        for k, tgt in keys:
+            src, *deft = values[k]
+            tgts.append((tgt, *deft) if tgt is src else (tgt,))
+        return Struct(tuple(k for k, _ in keys), tuple(tgts))
+
+    def copy(self):
+        """
+        Shallow copy, sharing field values with `self`.
+        """
+        out = object.__new__(self.__class__)
+        for k in self.__slots__:
+            setattr(out, k, getattr(self, k))
+        return out
+
+    def replace(self, **ys):
+        """
+        Pure update of fields, sharing other field values with `self`.
+        """
+        out = self.copy()
+        for name, (Tx, *_) in zip(self._keys_, self._values_):
+            if name in ys:
+                setattr(out, name, utils.cast(ys.pop(name), Tx))
+        if len(ys):
+            raise utils.KeyError(f"Unknown keys {tuple(ys)} for {self.__class__}")
+        return out
 
     def apply(self, **fs):
         for key, f in fs.items():
@@ -162,9 +259,156 @@ class StructObject(metaclass=Type):
             setattr(self, key, f(x))
 
 
+class StructBatch(metaclass=Type):
+    """
+    Base class for columnar batches of `Struct` objects.
+
+    A batch of type `S.Batch` holds one column per field of the struct
+    type `S`. Columns are either arrays (kept as is) or typed lists
+    `List(V)`. Rows are only created as `S` instances on access.
+
+    Example:
+    --------
+    .. code::
+
+        >>> people = Person.Batch(["Jack", "Lucy"], phone=[[0], [1]])
+        >>> people.name
+        List Str : ['Jack', 'Lucy']
+        >>> people[1]
+        {
+            name: 'Lucy',
+            phone: [1]
+        }
+    """
+
+    _struct_: type
+
+    def __init__(self, *xs, **ys):
+        """
+        Initialize columns.
+        """
+        S = self._struct_
+        nargs = len(xs)
+        fields = [(k, *v) for k, v in zip(S._keys_, S._values_)]
+        columns = {}
+        for x, (name, Tx, *_) in zip(xs, fields):
+            columns[name] = self._column_(x, Tx)
+        for name, Tx, *val in fields[nargs:]:
+            if name in ys:
+                columns[name] = self._column_(ys[name], Tx)
+            elif not len(val):
+                raise utils.KeyError(
+                    f"Missing key {name} creating a {self.__class__} instance."
+                )
+        sizes = {len(col) for col in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Columns of unequal lengths {sizes} in {S}.Batch")
+        size = sizes.pop() if len(sizes) else 0
+        for name, Tx, *val in fields:
+            if name not in columns:
+                columns[name] = self._column_([val[0]] * size, Tx)
+        # rows are built positionally, in field order
+        self._columns_ = {k: columns[k] for k in S._keys_}
+        self._size_ = size
+
+    @staticmethod
+    def _column_(xs, Tx):
+        """Cast a column to `List(Tx)` unless it is an array."""
+        if hasattr(xs, "shape") or isinstance(xs, List(Tx)):
+            return xs
+        return List(Tx)(xs)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Columnar batch of an iterable of rows.
+        """
+        S = cls._struct_
+        rows = [utils.cast(row, S) for row in rows]
+        return cls(*([getattr(row, k) for row in rows] for k in S._keys_))
+
+    def __len__(self):
+        return self._size_
+
+    def __iter__(self):
+        for i in range(self._size_):
+            yield self[i]
+
+    def __getattr__(self, k):
+        try:
+            return self.__dict__["_columns_"][k]
+        except KeyError:
+            raise AttributeError(k)
+
+    def __getitem__(self, i):
+        if isinstance(i, str):
+            return self._columns_[i]
+        if isinstance(i, slice):
+            return self.__class__(*(col[i] for col in self._columns_.values()))
+        return self._struct_(*(col[i] for col in self._columns_.values()))
+
+    def keys(self):
+        return self._struct_._keys_
+
+    def items(self):
+        return self._columns_.items()
+
+    def rows(self):
+        """List of row structs."""
+        return List(self._struct_)(self)
+
+    def __str__(self):
+        return showStruct(self._columns_)
+
+    def __repr__(self):
+        return showStruct(self._columns_)
+
+    def pull(self, keys):
+        """
+        Batch of the struct type restricted to `keys`.
+        """
+        if isinstance(keys, tuple):
+            S = self._struct_
+            values = tuple(S._values_[S._keys_.index(k)] for k in keys)
+            return Struct(keys, values).Batch(*(self._columns_[k] for k in keys))
+
+    def map(self, **fs):
+        """
+        Map functions on columns, returning a batch of mapped fields.
+
+        Typed arrows are mapped by `Hom.map_batch`, other callables are
+        applied to whole array columns (e.g. numpy ufuncs) and element-wise
+        on list columns. Output field types are read from `(f, tgt)` pairs
+        or `f.tgt`, and inferred from the mapped values otherwise.
+        """
+        S = self._struct_
+        keys, values, ys = [], [], []
+        for key, (src, *deft) in zip(S._keys_, S._values_):
+            if key not in fs:
+                continue
+            f = fs[key]
+            f, tgt = f if type(f) is tuple else (f, getattr(f, "tgt", None))
+            xs = self._columns_[key]
+            if isinstance(f, Hom.Object):
+                y = f.map_batch(xs)
+            elif hasattr(xs, "shape"):
+                y = f(xs)
+            else:
+                y = [f(x) for x in xs]
+            if tgt is None:
+                tgt = type(y[0]) if len(y) and not hasattr(y, "shape") else src
+            keys.append(key)
+            values.append((tgt, *deft) if tgt is src else (tgt,))
+            ys.append(y)
+        return Struct(tuple(keys), tuple(values)).Batch(*ys)
+
+
 # alias for pointed types (T, val:T)
 Value = tuple[Type, typing.Any]
 
+# sentinel for missing arguments of generated constructors
+_missing = object()
+
 
 class Struct(Type, metaclass=Cofunctor):
 
@@ -220,6 +464,112 @@ class Struct(Type, metaclass=Cofunctor):
     def _post_new_(S, keys, values, name=None, bases=(), dct=None):
         for k, (V, *v) in zip(keys, values):
             Field.bind((S, k), (V, *v))
+        # specialized methods
+        for k, method in Struct._compile_methods_(S).items():
+            if Struct._is_generic_(S, k):
+                setattr(S, k, method)
+
+    @staticmethod
+    def _is_generic_(S, k) -> bool:
+        """
+        Whether the method `k` of `S` may be replaced by a generated one.
+
+        This holds if `S` would otherwise resolve `k` to the generic
+        `StructObject` method, to a method generated for a parent struct,
+        or to nothing, but not if `S` or a parent defines it.
+        """
+        for C in S.__mro__:
+            if k in C.__dict__:
+                method = C.__dict__[k]
+                method = getattr(method, "__func__", method)
+                return C is StructObject or hasattr(method, "_compiled_")
+        return True
+
+    @staticmethod
+    def _compile_methods_(S) -> dict[str, typing.Callable]:
+        """
+        Generate the `__init__`, `make_unchecked`, `replace` and `copy`
+        methods of `S`.
+
+        Like dataclasses, the generated methods take struct keys as
+        arguments and access slots directly. The `__init__` and `replace`
+        methods only cast values which are not already instances of their
+        field type, while `make_unchecked` trusts its inputs and only casts
+        defaults. Returns `{}` if keys cannot be used as argument names,
+        leaving the generic `StructObject` methods in place.
+        """
+        reserved = {"cast", "missing", "_s_", "_o_", "_args_", "_kws_", "_new_", "_S_"}
+        keys = S._keys_
+        if any(not k.isidentifier() or keyword.iskeyword(k) for k in keys):
+            return {}
+        if reserved & set(keys):
+            return {}
+
+        env = {"cast": utils.cast, "missing": _missing, "_S_": S}
+        env["KeyError"] = utils.KeyError
+        env["_new_"] = object.__new__
+        args, init, unchecked, replace = [], [], [], []
+        for i, (k, (V, *v)) in enumerate(zip(keys, S._values_)):
+            slot = S.__dict__[k].slot_descriptor
+            env[f"_T{i}_"] = V
+            env[f"_get{i}_"] = slot.__get__
+            env[f"_set{i}_"] = slot.__set__
+            args.append(f"{k}=missing")
+            if len(v):
+                env[f"_d{i}_"] = v[0]
+                default = f"{k} = cast(_d{i}_, _T{i}_)"
+            else:
+                msg = f"Missing key {k} creating a {{_S_}} instance."
+                default = f'raise KeyError(f"{msg}")'
+            cast = [
+                f"    elif not isinstance({k}, _T{i}_):",
+                f"        {k} = cast({k}, _T{i}_)",
+            ]
+            init += [
+                f"    if {k} is missing:",
+                f"        {default}",
+                *cast,
+                f"    _set{i}_(_s_, {k})",
+            ]
+            unchecked += [
+                f"    if {k} is missing:",
+                f"        {default}",
+                f"    _set{i}_(_s_, {k})",
+            ]
+            replace += [
+                f"    if {k} is missing:",
+                f"        {k} = _get{i}_(_s_)",
+                *cast,
+                f"    _set{i}_(_o_, {k})",
+            ]
+        kwargs = ", ".join(["_s_", *args, "*_args_", "**_kws_"])
+        updates = ", ".join(["_s_", "*", *args]) if len(args) else "_s_"
+        code = "\n".join(
+            [
+                f"def __init__({kwargs}):",
+                *init,
+                "    return None",
+                f"def make_unchecked({kwargs}):",
+                "    _s_ = _new_(_s_)",
+                *unchecked,
+                "    return _s_",
+                f"def replace({updates}):",
+                "    _o_ = _new_(_s_.__class__)",
+                *replace,
+                "    return _o_",
+                "def copy(_s_):",
+                "    return replace(_s_)",
+            ]
+        )
+        exec(code, env)
+        for k in ("__init__", "make_unchecked", "replace", "copy"):
+            env[k]._compiled_ = True
+        return {
+            "__init__": env["__init__"],
+            "make_unchecked": classmethod(env["make_unchecked"]),
+            "replace": env["replace"],
+            "copy": env["copy"],
+        }
 
     @classmethod
     def _annotations_(cls, C):
@@ -267,6 +617,16 @@ class Struct(Type, metaclass=Cofunctor):
         for k in S._keys_:
             yield k
 
+    @property
+    def Batch(S) -> type:
+        """
+        Columnar batch type of `S`, see :class:`StructBatch`.
+        """
+        if "_batch_" not in S.__dict__:
+            name = S.__name__ + ".Batch"
+            S._batch_ = Type(name, (StructBatch,), {"_struct_": S})
+        return S._batch_
+
     def items(S):
         for k, (V, *v) in zip(S._keys_, S._values_):
             yield k, V
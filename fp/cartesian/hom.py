@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import functools
+import importlib
+import pickle
+import weakref
 
 import types
 from typing import Iterable, Callable, Literal
@@ -9,6 +12,36 @@ from fp import utils
 from fp.meta import Type, Var, HomFunctor, ArrowFunctor
 from .arrow import Arrow
 
+# typing hooks defined by Hom heads, see `_typing_hooks`
+_hooks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _typing_hooks(head) -> tuple[bool, bool]:
+    """
+    Whether a head defines value-dependent `source_type` and `target_type`.
+
+    Computed once per head, as `dir` scans are slow.
+    """
+    try:
+        return _hooks[head]
+    except (KeyError, TypeError):
+        names = dir(head)
+        hooks = ("source_type" in names, "target_type" in names)
+    try:
+        _hooks[head] = hooks
+    except TypeError:
+        # not weakly referenceable
+        pass
+    return hooks
+
+
+def _import_arrow(module: str, qualname: str):
+    """Import an arrow by reference, see :meth:`HomObject.__reduce__`."""
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
 
 class HomObject(Arrow.Object):
     """
@@ -22,6 +55,13 @@ class HomObject(Arrow.Object):
     # reference to Hom
     _head_: HomFunctor
 
+    # specialized call sites, keyed by input types
+    _calls_: dict[tuple[type, ...], Callable] | None = None
+    _max_calls_: int = 16
+
+    # vectorized implementation on arrays, see `vectorize`
+    _kernel_: Callable | None = None
+
     def __init__(self, pipe: Callable | tuple[Callable, ...]):
         """Wrap callable(s) in the monoidal tuple type.
 
@@ -39,10 +79,30 @@ class HomObject(Arrow.Object):
         # set __name__
         if callable(pipe):
             self.__name__ = pipe.__name__ if pipe.__name__ != "<lambda>" else "λ"
+            # wrapped callable, see `AsyncIO.lift_blocking`
+            self._fn_ = pipe
+            self._origin_ = (
+                getattr(pipe, "__module__", None),
+                getattr(pipe, "__qualname__", None),
+            )
 
     def __call__(self, *xs) -> tgt:
         """Evaluate morphism on inputs."""
 
+        # --- Specialized call sites
+        if not any(_typing_hooks(self._head_)):
+            key = tuple(type(x) for x in xs)
+            calls = self._calls_
+            if calls is not None and key in calls:
+                return calls[key](xs)
+            call = self._specialize_(xs)
+            if call is not None:
+                if calls is None:
+                    calls = self._calls_ = {}
+                if len(calls) < self._max_calls_:
+                    calls[key] = call
+                return call(xs)
+
         def pipe(x):
             for f in self._pipe:
                 x = f(x)
@@ -75,12 +135,158 @@ class HomObject(Arrow.Object):
         print(self.arity, len(xs))
         raise utils.TypeError("input", xs, self.src)
 
+    def _specialize_(self, xs: tuple) -> Callable | None:
+        """
+        Resolve input and output types of a full application on `xs`.
+
+        The returned callable evaluates the pipe on inputs of the same types
+        as `xs`, with input and output casts decided once and for all.
+        It is cached by `__call__` on the tuple of input types.
+        Returns `None` for partial applications, constants, and arrows whose
+        `_head_` defines value-dependent `source_type` or `target_type` hooks.
+        """
+        r, n = self.arity, len(xs)
+        if r == 0 or not (n == r or (n == 1 and isinstance(xs[0], self.src))):
+            return None
+        if any(_typing_hooks(self._head_)):
+            return None
+
+        Src, match = self.source_type(self, xs)
+        Tgt = self.target_type(self, xs, match)
+        pipe = self._pipe
+        cast = utils.cast
+
+        # --- Input cast
+        if n == 1:
+            if isinstance(xs[0], Src) or isinstance(Src, Var):
+                source = lambda xs: xs[0]
+            else:
+                source = lambda xs: cast(xs[0], Src)
+        elif isinstance(Src, Var):
+            source = lambda xs: xs
+        elif all(isinstance(x, S) for x, S in zip(xs, Src._tail_)):
+            source = lambda xs: xs
+        else:
+            source = lambda xs: cast(xs, Src)
+
+        # --- Output cast
+        if isinstance(Tgt, Var):
+
+            def call(xs):
+                x = source(xs)
+                for f in pipe:
+                    x = f(x)
+                return x
+
+        else:
+
+            def call(xs):
+                x = source(xs)
+                for f in pipe:
+                    x = f(x)
+                return cast(x, Tgt)
+
+        return call
+
+    def vectorize(self, kernel: Callable) -> HomObject:
+        """Declare a vectorized kernel, used by :meth:`map_batch` on arrays.
+
+        The kernel maps a batch of inputs stacked along the first axis
+        to the batch of outputs. It may be used as a decorator:
+
+        .. code::
+
+            >>> square = Hom(Float, Float)(lambda x: x * x)
+            >>> @square.vectorize
+            ... def square(xs):
+            ...     return xs**2
+        """
+        self._kernel_ = kernel
+        return self
+
+    def map_batch(self, xs):
+        """
+        Apply the arrow to a batch of inputs.
+
+        Arrays (`Tensor` instances or backend arrays) are mapped by the
+        vectorized kernel if one was declared, see :meth:`vectorize`.
+        So are packed numeric lists, see :meth:`List.packed`, whose
+        kernel outputs are packed to `List.packed(tgt)` if possible.
+
+        Other iterables are cast once to `List(src)`, the raw pipe is run
+        on each element and outputs are cast once to `List(tgt)`,
+        skipping the typed application of `__call__` on every element.
+        """
+        from fp.base import List
+
+        # --- Array batches
+        if hasattr(xs, "_interface_"):
+            if self._kernel_ is not None:
+                return xs.__class__(self._kernel_(xs.data))
+            return xs.__class__.asarray([self(x) for x in xs])
+        if self._kernel_ is not None and hasattr(xs, "shape"):
+            return self._kernel_(xs)
+        if self._kernel_ is not None and isinstance(xs, List.Packed):
+            packed = self.tgt in List._typecodes_
+            LB = List.packed(self.tgt) if packed else List(self.tgt)
+            return LB(self._kernel_(xs.__array__()))
+
+        # --- Generic arrows
+        head = self._head_
+        dynamic = any(_typing_hooks(head))
+        if dynamic or isinstance(self.src, Var) or isinstance(self.tgt, Var):
+            ys = [self(x) for x in xs]
+            Tgt = type(ys[0]) if len(ys) and isinstance(self.tgt, Var) else self.tgt
+            return List(Tgt)(ys)
+
+        # --- Typed batches
+        LA, LB = List(self.src), List(self.tgt)
+        xs = xs if isinstance(xs, LA) else LA(xs)
+        if len(self._pipe) == 1:
+            f = self._pipe[0]
+            return LB([f(x) for x in xs])
+
+        def pipe(x):
+            for f in self._pipe:
+                x = f(x)
+            return x
+
+        return LB([pipe(x) for x in xs])
+
+    def __reduce__(self):
+        """
+        Pickle arrows by reference to the module-level name they are bound to.
+
+        This holds for decorated functions, e.g. `@Hom(Int, Int) def inc`,
+        and raises `pickle.PicklingError` on other arrows.
+        """
+        if not self._importable_():
+            raise pickle.PicklingError(f"Cannot pickle arrow {self} by reference")
+        return (_import_arrow, self._origin_)
+
+    def _importable_(self) -> bool:
+        """Whether the arrow is bound to its module-level name."""
+        module, qualname = self.__dict__.get("_origin_", (None, None))
+        if module is None or qualname is None or "<locals>" in qualname:
+            return False
+        try:
+            return _import_arrow(module, qualname) is self
+        except (ImportError, AttributeError):
+            return False
+
     def __lshift__(self, x: src) -> tgt:
         return self(x)
 
     def __rshift__(self, other):
         return self._head_.compose(self, other)
 
+    def fuse(self, *fs, elide: bool = True):
+        """Compile the pipe of `self >> f1 >> ...` into a single function.
+
+        See :meth:`Hom.fuse`.
+        """
+        return self._head_.fuse(self, *fs, elide=elide)
+
     def __str__(self):
         if hasattr(self, "__name__"):
             return self.__name__
@@ -108,7 +314,7 @@ class HomObject(Arrow.Object):
     def source_type(arrow, xs) -> tuple[type, bool | dict]:
         """Infer input type for downstream cast."""
         Prod = Type.Prod
-        if "source_type" in dir(arrow._head_):
+        if _typing_hooks(arrow._head_)[0]:
             # TODO: is this necessary?
             Src = arrow._head_.source_type(arrow, xs)
 
@@ -168,7 +374,7 @@ class HomObject(Arrow.Object):
         def subst(ty):
             return ty.substitute(match) if isinstance(ty, Var) else ty
 
-        if "target_type" in dir(arrow._head_):
+        if _typing_hooks(arrow._head_)[1]:
             return arrow._head_.target_type(arrow, xs)
         if len(xs) == arrow.arity or (len(xs) == 1 and isinstance(xs[0], arrow.src)):
             # full application type
@@ -259,6 +465,77 @@ class Hom(Arrow, metaclass=HomFunctor):
         pipe.__name__ = cls._composed_name_(f, *fs)
         return pipe
 
+    @classmethod
+    def fuse(cls, f, *fs, elide: bool = True):
+        """
+        Compose a collection of functions into a single generated function.
+
+        The returned arrow has the source and target types of
+        `Hom.compose(f, *fs)`, but its pipe holds a single function whose
+        body unrolls the pipes of `f, *fs`, and casts values passed from
+        one arrow to the next:
+
+        .. code::
+
+            def fused(x):
+                x = f0(x)
+                x = cast(x, T1)
+                x = f1(x)
+                ...
+                return x
+
+        Intermediate values are cast to the source type `T1, ...` of the
+        next arrow, unless `elide` is true and it is the target type of the
+        previous one, or it holds type variables, in which case the cast
+        is skipped.
+
+        **Note:**
+        Unlike `Hom.compose`, which never casts between arrows, fused arrows
+        may thus accept mismatched types:
+
+        .. code::
+
+            >>> half = Hom(int, float)(lambda x: x / 2)
+            >>> bar = Hom(int, str)(lambda n: "|" * n)
+            >>> Hom.fuse(half, bar)(5)
+            '||'
+            >>> Hom.compose(half, bar)(5)
+            TypeError: can't multiply sequence by non-int of type 'float'
+
+        **Note:**
+        Fusing a single arrow compiles its pipe, e.g. after a sequence of
+        compositions.
+        """
+        src = f.src
+        tgt = (fs[-1] if len(fs) else f).tgt
+        fused = cls(src, tgt)((cls._fused_pipe_(f, *fs, elide=elide),))
+        fused.__name__ = cls._composed_name_(f, *fs)
+        return fused
+
+    @staticmethod
+    def _fused_pipe_(*fs, elide: bool = True) -> Callable:
+        """Generate the source code of a fused pipe and compile it."""
+        env = {"cast": utils.cast}
+        lines = ["def fused(x):"]
+        for i, fi in enumerate(fs):
+            elided = elide and fs[i - 1].tgt is fi.src
+            if i > 0 and not elided and not Hom._polymorphic_(fi.src):
+                env[f"T{i}"] = fi.src
+                lines.append(f"    x = cast(x, T{i})")
+            for j, fij in enumerate(fi._pipe):
+                env[f"f{i}_{j}"] = fij
+                lines.append(f"    x = f{i}_{j}(x)")
+        lines.append("    return x")
+        exec("\n".join(lines), env)
+        return env["fused"]
+
+    @staticmethod
+    def _polymorphic_(T) -> bool:
+        """Whether `T` or any of its components is a type variable."""
+        if isinstance(T, Var):
+            return True
+        return any(Hom._polymorphic_(A) for A in getattr(T, "_tail_", ()))
+
     @classmethod
     def eval(cls, x: A, f: callable[A, B]) -> B:
         """
@@ -330,7 +607,7 @@ class Hom(Arrow, metaclass=HomFunctor):
         if len(fs) <= 4:
             return " . ".join(name(f) for f in fs[::-1])
         else:
-            return "(" + name(fs[0]) + " . ... . " + str(name[-1]) + ")"
+            return "(" + name(fs[-1]) + " . ... . " + name(fs[0]) + ")"
 
     @classmethod
     def _parse_input_(cls, A, B):
@@ -1,4 +1,4 @@
-from fp.meta import Type, NFunctor, Functor
+from fp.meta import Type, NFunctor, Functor, Var
 from typing import Callable
 import fp.utils as utils
 
@@ -37,11 +37,17 @@ class Prod(Type, metaclass=Functor):
         """
 
         def __new__(P, *xs):
+            if P._typed_(xs):
+                return tuple.__new__(P, xs)
             if len(xs) != len(P._tail_):
                 raise TypeError(f"Got {len(xs)} terms in product type {P.__name__}")
             xs = [utils.cast(x, A) for A, x in zip(P._tail_, xs)]
             return super().__new__(P, xs)
 
+        @staticmethod
+        def _typed_(xs):
+            return False
+
         def __init__(prod, *xs): ...
 
         def __str__(self):
@@ -70,6 +76,49 @@ class Prod(Type, metaclass=Functor):
 
     def __init__(P, *As): ...
 
+    def _post_new_(P, *As):
+        P._typed_ = staticmethod(Prod._compile_typed_(As))
+
+    @staticmethod
+    def _compile_typed_(As):
+        """
+        Compile the isinstance plan of a product type.
+
+        The returned predicate is true when a tuple of values can be wrapped
+        as is, without casting any of its terms. Type variables accept any
+        value.
+        """
+        env = {f"A{i}": A for i, A in enumerate(As)}
+        checks = [f"isinstance(x{i}, A{i})" for i, A in enumerate(As)
+                  if not isinstance(A, Var)]
+        xs = "".join(f"x{i}, " for i in range(len(As)))
+        code = (
+            "def typed(xs):\n"
+            f"    if len(xs) != {len(As)}:\n"
+            "        return False\n"
+            + (f"    {xs}= xs\n" if checks else "")
+            + f"    return {' and '.join(checks) or 'True'}\n"
+        )
+        exec(code, env)
+        return env["typed"]
+
+    @staticmethod
+    def _compile_tuple_(fs, branch=False):
+        """
+        Compile the joint action of maps to a single tuple expression.
+
+        Return `(x0, x1, ...) -> (f0(x0), f1(x1), ...)`, or
+        `x -> (f0(x), f1(x), ...)` if `branch` is true.
+        """
+        env = {f"f{i}": f for i, f in enumerate(fs)}
+        if branch:
+            args, ys = "x", [f"f{i}(x)" for i in range(len(fs))]
+        else:
+            args = ", ".join(f"x{i}" for i in range(len(fs)))
+            ys = [f"f{i}(x{i})" for i in range(len(fs))]
+        exec(f"def map_f({args}):\n    return ({''.join(y + ', ' for y in ys)})", env)
+        return env["map_f"]
+
     def __getitem__(P, i: int | slice):
         if isinstance(i, int):
             return P._tail_[i]
@@ -90,11 +139,7 @@ class Prod(Type, metaclass=Functor):
         src = cls(*(f.src for f in fs))
         tgt = cls(*(f.tgt for f in fs))
 
-        @Type.Hom(src, tgt)
-        def map_f(*xs):
-            ys = tuple(f(x) for x, f in zip(xs, fs))
-            return ys
-
+        map_f = Type.Hom(src, tgt)(cls._compile_tuple_(fs))
         map_f.__name__ = cls._fmap_name_(*fs)
         return map_f
 
@@ -118,11 +163,7 @@ class Prod(Type, metaclass=Functor):
         src = f.src
         tgt = cls(*(fi.tgt for fi in (f, *fs)))
 
-        @Type.Hom(src, tgt)
-        def branch_f(x):
-            """Map a souce type `X` to a product `(A, B, ...)`."""
-            return (fi(x) for fi in (f, *fs))
-
+        branch_f = Type.Hom(src, tgt)(cls._compile_tuple_((f, *fs), branch=True))
         branch_f.__name__ = "branch " + cls._fmap_name_(f, *fs)
         return branch_f
 
@@ -4,6 +4,7 @@ from .wrap import Wrap
 from .state import State, StateMonad
 from .stateful import Stateful
 from .async_io import AsyncIO
+from .async_stream import AsyncStream
 
 __all__ = [
     "Wrap",
@@ -11,4 +12,5 @@ __all__ = [
     "StateMonad",
     "Stateful",
     "AsyncIO",
+    "AsyncStream",
 ]
@@ -1,20 +1,128 @@
 from __future__ import annotations
 import asyncio
 import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
 from typing import Awaitable, Iterable, TypeAlias
 
 from fp.meta import Type, Monad
 from fp.cartesian import Type, Hom
-from fp.base import Str
+from fp.base import Str, List
 import fp.utils as utils
 
 
+# event loop runner of `AsyncIO.runtime` blocks, per thread
+_runtime = threading.local()
+
+
+def _run(coro):
+    """Run a coroutine in the current runtime, or in a new event loop."""
+    runner = getattr(_runtime, "runner", None)
+    if runner is None:
+        return asyncio.run(coro)
+    return runner.run(coro)
+
+
+# managed executors of `AsyncIO.pool`, keyed by kind and size
+_pools = {}
+
+
+def _portable(x):
+    """
+    Strip parameterised fp types from containers before pickling.
+
+    Types such as `List(Int)` or `Prod(Int, Str)` are created at runtime
+    and cannot be pickled by reference: their values are sent to worker
+    processes as plain lists and tuples, and cast back on return.
+    """
+    T = type(x)
+    if T in (list, tuple) or not isinstance(x, (list, tuple, List.Packed)):
+        return x
+    if not hasattr(T, "_head_"):
+        return x
+    base = tuple if isinstance(x, tuple) else list
+    return base(_portable(xi) for xi in x)
+
+
+def _call_pipe(pipe, x, arity: int = 1):
+    """
+    Evaluate the raw pipe of an arrow, in a worker process.
+
+    The pipe is either an arrow, a tuple of functions, or the callable
+    wrapped by an arrow of arity `arity`, star-applied if `arity > 1`.
+    """
+    if isinstance(pipe, Hom.Object):
+        pipe = pipe._pipe
+    elif callable(pipe):
+        return _portable(pipe(*x) if arity > 1 else pipe(x))
+    for f in pipe:
+        x = f(x)
+    return _portable(x)
+
+
 async def _sleep(seconds: int | float) -> Type.Unit:
     """Sleep and return ()."""
     await asyncio.sleep(seconds)
     return Type.Unit()
 
 
+async def _timed(i: int, io: Awaitable, timeout=None):
+    """Await `io` and return `(i, value)`, or `(i, None)` on timeout."""
+    if timeout is None:
+        return i, await io
+    try:
+        return i, await asyncio.wait_for(io, timeout)
+    except asyncio.TimeoutError:
+        return i, None
+
+
+async def _as_completed(ios: Iterable, limit: int, timeout=None):
+    """
+    Yield `(i, value)` pairs as the i-th process of `ios` completes.
+
+    At most `limit` processes are running at once, and `ios` is only
+    consumed as slots are released. Running processes are cancelled
+    when an error is raised or when the generator is closed, and errors
+    of other completed processes are discarded.
+    """
+    if limit < 1:
+        raise ValueError(f"Concurrency limit must be positive, got {limit}")
+    pending, done = set(), set()
+    try:
+        for i, io in enumerate(ios):
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                while done:
+                    yield done.pop().result()
+            pending.add(asyncio.ensure_future(_timed(i, io(), timeout)))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            while done:
+                yield done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # retrieve errors of completed processes which were not yielded
+        for task in done:
+            if not task.cancelled():
+                task.exception()
+
+
+async def _gather(ios: Iterable, limit: int, timeout=None, ordered=True) -> list:
+    """Collect the values of `ios`, see :meth:`AsyncIO.gather_bounded`."""
+    if not ordered:
+        return [x async for i, x in _as_completed(ios, limit, timeout)]
+    out = {}
+    async for i, x in _as_completed(ios, limit, timeout):
+        out[i] = x
+    return [out[i] for i in range(len(out))]
+
+
 class AsyncIO(Type, metaclass=Monad):
     """
     Asynchronous promises for type values.
@@ -62,7 +170,13 @@ class AsyncIO(Type, metaclass=Monad):
             return out
 
         def run(self):
-            return asyncio.run(self.__await__())
+            """
+            Run the process and return its output value.
+
+            Within an :meth:`AsyncIO.runtime` block, the runtime's event
+            loop is reused instead of creating a new one.
+            """
+            return _run(self())
 
         async def __call__(self):
             out = await self
@@ -101,6 +215,130 @@ class AsyncIO(Type, metaclass=Monad):
         tgt = io_fn.tgt
         return tgt((*io._pipe, io_fn))
 
+    # --- Runtime ---
+
+    @classmethod
+    @contextmanager
+    def runtime(cls, max_workers: int | None = None, debug: bool | None = None):
+        """
+        Keep a single event loop alive for every `run` call in the block.
+
+        The loop and its default executor, a thread pool of `max_workers`
+        threads, are created on entry and closed on exit. Runtimes are
+        local to the calling thread; nested blocks reuse the outer loop.
+
+            >>> with AsyncIO.runtime():
+            ...     for io in ios:
+            ...         io.run()
+        """
+        runner = getattr(_runtime, "runner", None)
+        if runner is not None:
+            yield runner
+            return
+        with asyncio.Runner(debug=debug) as runner:
+            if max_workers is not None:
+                executor = ThreadPoolExecutor(max_workers)
+                runner.get_loop().set_default_executor(executor)
+            _runtime.runner = runner
+            try:
+                yield runner
+            finally:
+                _runtime.runner = None
+
+    @classmethod
+    def run_many(cls, ios: Iterable[cls.Object], max_concurrency=None) -> list:
+        """
+        Run asynchronous processes concurrently in a single loop entry.
+
+        Returns the list of output values, in the order of `ios`.
+        At most `max_concurrency` processes are running at once if given,
+        see :meth:`gather_bounded`.
+        """
+        if max_concurrency is not None:
+            return _run(_gather(ios, max_concurrency))
+
+        async def gather():
+            return list(await asyncio.gather(*(io() for io in ios)))
+
+        return _run(gather())
+
+    @classmethod
+    def pool(cls, kind: str = "thread", max_workers: int | None = None) -> Executor:
+        """
+        Managed executor of `kind` `"thread"` or `"process"`.
+
+        Executors are created on first use and shared by size, until
+        :meth:`shutdown` is called.
+        """
+        key = (kind, max_workers)
+        if key not in _pools:
+            if kind == "thread":
+                _pools[key] = ThreadPoolExecutor(max_workers)
+            elif kind == "process":
+                _pools[key] = ProcessPoolExecutor(max_workers)
+            else:
+                raise ValueError(f"Unknown executor kind {kind}")
+        return _pools[key]
+
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        """Shut down managed executors, see :meth:`pool`."""
+        while _pools:
+            _, executor = _pools.popitem()
+            executor.shutdown(wait=wait)
+
+    @classmethod
+    def lift_blocking(
+        cls,
+        f: Hom,
+        executor: str | Executor = "thread",
+        max_workers: int | None = None,
+    ) -> Hom:
+        """
+        Lift a blocking arrow `f : A -> B` to `A -> AsyncIO(B)`.
+
+        The returned processes evaluate `f` in an executor, without
+        blocking the event loop. `executor` is either an `Executor`
+        instance or one of:
+
+        * `"thread"`: the loop's default executor, or a managed thread
+          pool of `max_workers` threads if given, see :meth:`pool`.
+        * `"process"`: a managed process pool of `max_workers` processes.
+          Arrows bound to a module-level name (e.g. decorated functions)
+          are sent to workers by reference, other arrows send the
+          callable they wrap, or their raw pipe if composed, which must
+          then only hold picklable (module-level) functions. Inputs and
+          outputs of parameterised types are sent as plain tuples and
+          lists, and outputs are cast to `B` on return.
+        """
+        process = executor == "process" or isinstance(executor, ProcessPoolExecutor)
+        if isinstance(executor, str) and (process or max_workers is not None):
+            executor = cls.pool(executor, max_workers)
+        elif isinstance(executor, str):
+            executor = None
+        B, arity = f.tgt, f.arity
+        if process and f._importable_():
+            pipe = f
+        else:
+            pipe = getattr(f, "_fn_", f._pipe)
+
+        @Hom(f.src, cls(B))
+        def blocking_f(*xs):
+
+            async def run_f():
+                loop = asyncio.get_running_loop()
+                if not process:
+                    return await loop.run_in_executor(executor, f, *xs)
+                x = _portable(xs[0] if arity == 1 else xs)
+                y = await loop.run_in_executor(executor, _call_pipe, pipe, x, arity)
+                return utils.cast(y, B)
+
+            run_f.__name__ = f.__name__
+            return cls(B)(run_f)
+
+        blocking_f.__name__ = "blocking " + f.__name__
+        return blocking_f
+
     # --- IO methods ---
 
     @classmethod
@@ -144,6 +382,61 @@ class AsyncIO(Type, metaclass=Monad):
 
         return wait
 
+    @classmethod
+    def gather_bounded(
+        cls,
+        ios: Iterable[cls.Object],
+        max_concurrency: int = 16,
+        timeout=None,
+        ordered: bool = True,
+    ) -> cls.Object:
+        """
+        Run asynchronous processes with at most `max_concurrency` at once.
+
+        Returns a process yielding the list of output values, in the order
+        of `ios` or in order of completion if `ordered` is false. Processes
+        still running after `timeout` seconds are cancelled and yield `None`.
+        If one of the processes fails, the others are cancelled.
+        """
+        ios = tuple(ios)
+        A = ios[0]._type_ if len(ios) else Type.Unit
+        tgt = List(A | None) if timeout is not None else List(A)
+
+        @cls(tgt)
+        async def gather():
+            return await _gather(ios, max_concurrency, timeout, ordered)
+
+        gather.__name__ = f"gather {len(ios)} ({max_concurrency})"
+        return gather
+
+    @classmethod
+    def map_concurrent(
+        cls,
+        f: Hom,
+        xs: Iterable,
+        limit: int = 16,
+        timeout=None,
+        ordered: bool = True,
+    ) -> cls.Object:
+        """
+        Map `f : A -> AsyncIO(B)` concurrently over `xs`.
+
+        The processes `f(x)` are only created as running slots are
+        released, so that at most `limit` are alive at once.
+        See :meth:`gather_bounded`.
+        """
+        B = getattr(f.tgt, "_type_", Type)
+        tgt = List(B | None) if timeout is not None else List(B)
+
+        @cls(tgt)
+        async def map_f():
+            ios = (f(x) for x in xs)
+            return await _gather(ios, limit, timeout, ordered)
+
+        name = f.__name__ if hasattr(f, "__name__") else "λ"
+        map_f.__name__ = f"map_concurrent {name} ({limit})"
+        return map_f
+
     @classmethod
     def clear(cls, n: int) -> cls.Object:
 
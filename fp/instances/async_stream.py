@@ -0,0 +1,292 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Iterable
+
+from fp.meta import Type, Monad
+from fp.cartesian import Type, Hom
+from fp.base import List
+
+from .async_io import AsyncIO, _as_completed
+
+
+class AsyncStream(Type, metaclass=Monad):
+    """
+    Asynchronous streams of type values.
+
+    The type `AsyncStream(A)` wraps async generator functions yielding
+    values of type `A`. Streams are lazy: values are only produced as
+    they are consumed, and every combinator holds a bounded number of
+    values, so that unbounded streams can be processed without being
+    materialized.
+
+        * `collect : AsyncStream(A) -> AsyncIO(List(A))`
+
+    Example
+    -------
+        >>> from fp.instances import AsyncStream
+        >>> @AsyncStream(Int)
+        ... async def naturals():
+        ...     n = 0
+        ...     while True:
+        ...         yield n
+        ...         n += 1
+        ...
+        >>> naturals.filter(lambda n: n % 2).batch(3).take(2).run()
+        [[1, 3, 5], [7, 9, 11]]
+    """
+
+    src = Type
+    tgt = Type
+
+    class Object(Monad.TopType):
+
+        _type_: Type
+
+        def __init__(self, gen: Callable[[], AsyncIterator]):
+            if not callable(gen):
+                raise AttributeError(f"{gen} is not callable")
+            self._gen = gen
+            name = getattr(gen, "__name__", "stream")
+            self.__name__ = name if name != "<lambda>" else "λ"
+
+        def __aiter__(self):
+            return aiter(self._gen())
+
+        def _derive_(self, gen, tgt=None, name=None):
+            """Return a stream of type `tgt` generated by `gen`."""
+            tgt = self._type_ if tgt is None else tgt
+            out = self._head_(tgt)(gen)
+            out.__name__ = self.__name__ + " | " + name
+            return out
+
+        # --- Combinators ---
+
+        def filter(self, p: Callable) -> AsyncStream.Object:
+            """Keep values `x` for which `p(x)` is true."""
+
+            async def filter_p():
+                async for x in self:
+                    if p(x):
+                        yield x
+
+            return self._derive_(filter_p, name="filter")
+
+        def take(self, n: int) -> AsyncStream.Object:
+            """Stop after the first `n` values, closing the stream."""
+            if n < 0:
+                raise ValueError(f"Count must be non-negative, got {n}")
+
+            async def take_n():
+                if n == 0:
+                    return
+                i = 0
+                async with aclosing(aiter(self)) as xs:
+                    async for x in xs:
+                        yield x
+                        i += 1
+                        if i >= n:
+                            return
+
+            return self._derive_(take_n, name=f"take {n}")
+
+        def batch(self, n: int) -> AsyncStream.Object:
+            """Group consecutive values in lists of length `n`.
+
+            The last batch may be shorter.
+            """
+            if n < 1:
+                raise ValueError(f"Batch size must be positive, got {n}")
+            LA = List(self._type_)
+
+            async def batch_n():
+                buffer = []
+                async for x in self:
+                    buffer.append(x)
+                    if len(buffer) == n:
+                        yield LA(buffer)
+                        buffer = []
+                if buffer:
+                    yield LA(buffer)
+
+            return self._derive_(batch_n, LA, f"batch {n}")
+
+        def window(self, n: int, step: int = 1) -> AsyncStream.Object:
+            """Sliding windows of `n` consecutive values, every `step` values."""
+            if n < 1 or step < 1:
+                raise ValueError(
+                    f"Window size and step must be positive, got {n} and {step}"
+                )
+            LA = List(self._type_)
+
+            async def window_n():
+                buffer = deque(maxlen=n)
+                i = 0
+                async for x in self:
+                    buffer.append(x)
+                    i += 1
+                    if len(buffer) == n and (i - n) % step == 0:
+                        yield LA(buffer)
+
+            return self._derive_(window_n, LA, f"window {n}")
+
+        def buffer(self, size: int) -> AsyncStream.Object:
+            """
+            Produce values ahead of consumption, at most `size` at a time.
+
+            Values are produced by a concurrent task writing to a bounded
+            queue: the producer waits whenever the queue is full. It is
+            cancelled when the consumer stops iterating.
+            """
+            if size < 1:
+                raise ValueError(f"Buffer size must be positive, got {size}")
+            done = object()
+
+            async def buffer_n():
+                queue = asyncio.Queue(maxsize=size)
+
+                async def produce():
+                    try:
+                        async for x in self:
+                            await queue.put((x, None))
+                        await queue.put((done, None))
+                    except Exception as e:
+                        await queue.put((done, e))
+
+                task = asyncio.ensure_future(produce())
+                try:
+                    while True:
+                        x, error = await queue.get()
+                        if error is not None:
+                            raise error
+                        if x is done:
+                            return
+                        yield x
+                finally:
+                    task.cancel()
+
+            return self._derive_(buffer_n, name=f"buffer {size}")
+
+        # --- Consumers ---
+
+        def collect(self) -> AsyncIO.Object:
+            """Gather all values in a list, as an `AsyncIO(List(A))` process."""
+            LA = List(self._type_)
+
+            @AsyncIO(LA)
+            async def collect():
+                return LA([x async for x in self])
+
+            collect.__name__ = "collect " + self.__name__
+            return collect
+
+        def run(self) -> List:
+            """Collect and return all values of a finite stream."""
+            return self.collect().run()
+
+        def __str__(self):
+            return self.__name__
+
+        def __repr__(self):
+            return self.__name__
+
+    @classmethod
+    def new(cls, A):
+        SA = super().new(A)
+        SA.src = Type.Unit
+        SA.tgt = A
+        SA._type_ = A
+        return SA
+
+    # --- Monad methods ---
+
+    @classmethod
+    def unit(cls, x) -> cls.Object:
+
+        async def return_x():
+            yield x
+
+        return_x.__name__ = f"return {x}"
+        return cls(type(x))(return_x)
+
+    @classmethod
+    def fmap(cls, f: Hom) -> Hom:
+        """Map `f : A -> B` on each value of streams."""
+
+        @Hom(cls(f.src), cls(f.tgt))
+        def map_f(stream):
+
+            async def gen():
+                async for x in stream:
+                    yield f(x)
+
+            return stream._derive_(gen, f.tgt, f.__name__)
+
+        map_f.__name__ = "map " + f.__name__
+        return map_f
+
+    @classmethod
+    def bind(cls, stream, f: Hom):
+        """Concatenate the streams `f(x)` for each value `x` of a stream."""
+
+        async def bind_f():
+            async for x in stream:
+                async for y in f(x):
+                    yield y
+
+        return stream._derive_(bind_f, f.tgt._type_, ">> " + f.__name__)
+
+    @classmethod
+    def join(cls, streams):
+        """Concatenate a stream of streams."""
+
+        async def join():
+            async for stream in streams:
+                async for y in stream:
+                    yield y
+
+        return streams._derive_(join, streams._type_._type_, "join")
+
+    # --- Sources ---
+
+    @classmethod
+    def from_iterable(cls, xs: Iterable, A: type | None = None) -> cls.Object:
+        """
+        Stream the values of a (synchronous or asynchronous) iterable.
+
+        The type `A` of values is read from `xs` if not given.
+        """
+        if A is None:
+            A = type(xs)._tail_[0] if isinstance(type(xs), List) else Type
+
+        async def iterate():
+            if hasattr(xs, "__aiter__"):
+                async for x in xs:
+                    yield x
+            else:
+                for x in xs:
+                    yield x
+
+        return cls(A)(iterate)
+
+    @classmethod
+    def as_completed(
+        cls,
+        ios: Iterable[AsyncIO.Object],
+        max_concurrency: int = 16,
+        timeout=None,
+    ) -> cls.Object:
+        """
+        Stream the output values of processes as they complete.
+
+        See :meth:`AsyncIO.gather_bounded`.
+        """
+        ios = tuple(ios)
+        A = ios[0]._type_ if len(ios) else Type.Unit
+
+        async def as_completed():
+            async for i, x in _as_completed(ios, max_concurrency, timeout):
+                yield x
+
+        return cls(A)(as_completed)
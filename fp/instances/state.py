@@ -1,7 +1,9 @@
+import operator
 from contextlib import contextmanager
 
 from fp.meta import Monad, HomFunctor, Var
 from fp.cartesian import Type, Hom, Prod
+from fp.base import List
 import fp.utils as utils
 
 Point = Type.Unit()
@@ -9,16 +11,126 @@ Point = Type.Unit()
 # TODO: too many pathways for gets, put, puts, etc.
 
 
+class Program:
+    """
+    Instruction list of a stateful computation.
+
+    Programs are persistent linked lists of `(op, f)` instructions, so that
+    appending a step is constant time and shares the prefix. Calling a program
+    on a state flattens it once and evaluates it in a loop:
+
+    * `"run"`:  `s, a = f(s)`
+    * `"then"`: `s, a = f(s, a)`
+    * `"gets"`: `a = f(s)`
+    * `"put"`:  `s, a = f, ()`
+    * `"puts"`: `s = f(s)`
+    * `"bind"`: evaluate the program of `f(a)` on `s`
+
+    Bound subprograms are run by the same loop with an explicit stack of
+    continuations, hence with constant Python stack depth. Binds in tail
+    position do not push a continuation.
+    """
+
+    __slots__ = ("prev", "op", "f", "_code")
+
+    def __init__(self, prev, op, f):
+        self.prev = prev
+        self.op = op
+        self.f = f
+        self._code = None
+
+    @classmethod
+    def run(cls, f):
+        return cls(None, "run", f)
+
+    def push(self, op, f):
+        return Program(self, op, f)
+
+    def code(self) -> tuple:
+        """Flat instruction tuple."""
+        if self._code is None:
+            steps, p = [], self
+            while p is not None and p._code is None:
+                steps.append((p.op, p.f))
+                p = p.prev
+            prefix = p._code if p is not None else ()
+            self._code = prefix + tuple(reversed(steps))
+        return self._code
+
+    def __len__(self):
+        return len(self.code())
+
+    def __call__(self, s):
+        code, pc, a = self.code(), 0, ()
+        stack = []
+        while True:
+            if pc == len(code):
+                if not stack:
+                    return s, a
+                code, pc = stack.pop()
+                continue
+            op, f = code[pc]
+            pc += 1
+            if op == "then":
+                s, a = f(s, a)
+            elif op == "bind":
+                m = f(a)
+                if pc < len(code):
+                    stack.append((code, pc))
+                program = getattr(m, "_program_", None)
+                code, pc = (program.code() if program else (("run", m),)), 0
+            elif op == "run":
+                s, a = f(s)
+            elif op == "gets":
+                a = f(s)
+            elif op == "put":
+                s, a = f, ()
+            elif op == "puts":
+                s = f(s)
+
+
+def _join_(fa):
+    return fa
+
+
 class StateObject(Monad.TopType, Hom.Object):
     """
     Stateful computation.
+
+    The computation is held as a :class:`Program`, wrapped as the only
+    callable of the `Hom` pipe.
     """
 
     def __init__(self, pipe, initial=None):
         self.__name__ = pipe.__name__ if hasattr(pipe, "__name__") else "st"
-        super().__init__(pipe)
+        if isinstance(pipe, Program):
+            program = pipe
+        elif isinstance(pipe, StateObject):
+            program = pipe._program_
+        else:
+            super().__init__(pipe)
+            program = Program.run(self._compose_(self._pipe))
+        self._program_ = program
+        self._pipe = (program,)
         self._initial_ = initial
 
+    @staticmethod
+    def _compose_(pipe):
+        if len(pipe) == 1:
+            return pipe[0]
+
+        def composed(x):
+            for f in pipe:
+                x = f(x)
+            return x
+
+        return composed
+
+    def _push_(self, op, f, tgt, name):
+        out = self._monad_(tgt)(self._program_.push(op, f), self._initial_)
+        out.__name__ = name
+        return out
+
     @property
     def _monad_(self):
         return self._head_(self._state_)
@@ -47,6 +159,40 @@ class StateObject(Monad.TopType, Hom.Object):
     def eval(self):
         return self.tgt.proj(1) @ self.run
 
+    def run_many(self, states, executor=None, chunksize=1):
+        """
+        Run the computation on many initial states.
+
+        States are cast once to `List(S)` and the program is evaluated on
+        each of them without typed dispatch, returning a `List(Prod(S, A))`.
+
+        An `concurrent.futures.Executor` may be given to distribute runs,
+        e.g. a `ProcessPoolExecutor` if the program only holds picklable
+        (module-level) callables.
+        """
+        return List(self.tgt)(self._run_raw_(states, executor, chunksize))
+
+    def run_batch(self, states, executor=None, chunksize=1):
+        """
+        Run the computation on many initial states, returning columns.
+
+        Returns a pair `(List(S), List(A))` of final states and values,
+        see :meth:`run_many`.
+        """
+        S, A = self._state_, self._value_
+        pairs = self._run_raw_(states, executor, chunksize)
+        ss, ys = zip(*pairs) if len(pairs) else ((), ())
+        return Prod(List(S), List(A))(List(S)(ss), List(A)(ys))
+
+    def _run_raw_(self, states, executor=None, chunksize=1):
+        LS = List(self.src)
+        states = states if isinstance(states, LS) else LS(states)
+        program = self._program_
+        program.code()
+        if executor is None:
+            return [program(s) for s in states]
+        return list(executor.map(program, states, chunksize=chunksize))
+
     @contextmanager
     def use(self, state):
         try:
@@ -62,24 +208,16 @@ class StateObject(Monad.TopType, Hom.Object):
     def then(self, f, tgt=None):
         if tgt is None:
             tgt = f.tgt[1]
-        pipe = (*self._pipe, lambda pair: f(*pair))
-        out = self._monad_(tgt)(pipe, self._initial_)
-        out.__name__ = self.__name__ + " ; " + f.__name__
-        return out
+        return self._push_("then", f, tgt, self.__name__ + " ; " + f.__name__)
 
     def gets(self, f, tgt=None):
         tgt = tgt or f.tgt
-        if callable(f):
-            get_f = lambda s, a: (s, f(s))
-        elif isinstance(f, str):
-            get_f = lambda s, a: (s, getattr(s, f))
-        get_f.__name__ = "get " + f.__name__
-        return self.then(get_f, tgt=tgt)
+        name = f if isinstance(f, str) else f.__name__
+        get_f = operator.attrgetter(f) if isinstance(f, str) else f
+        return self._push_("gets", get_f, tgt, self.__name__ + " ; get " + name)
 
     def put(self, s):
-        out = self.then(lambda *_: (s, ()), tgt=Type.Unit)
-        out.__name__ = self.__name__ + " >> put " + str(s)
-        return out
+        return self._push_("put", s, Type.Unit, self.__name__ + " >> put " + str(s))
 
     def unit(self, a):
         unit_a = lambda s, _: (s, a)
@@ -88,9 +226,8 @@ class StateObject(Monad.TopType, Hom.Object):
         return out
 
     def puts(self, f):
-        puts_f = lambda s, a: (f(s), a)
-        puts_f.__name__ = "put " + f.__name__
-        return self.then(puts_f, tgt=self._value_)
+        name = self.__name__ + " ; put " + f.__name__
+        return self._push_("puts", f, self._value_, name)
 
 
 class StateMonad(Type, metaclass=Monad):
@@ -149,16 +286,19 @@ class StateMonad(Type, metaclass=Monad):
         """
         Evaluate the returned stateful subprocess.
         """
-        S, A = cls._state_, ffa._value_._value_
+        A = ffa._value_._value_
+        return cls(A)(ffa._program_.push("bind", _join_), ffa._initial_)
 
-        def state_join(s0):
-            """
-            Flattened stateful computation.
-            """
-            s1, fa = ffa.run(s0)
-            return fa.run(s1)
+    @classmethod
+    def bind(cls, st_a, mf):
+        """
+        Evaluate the stateful subprocess `mf(a)` returned by `mf : A -> cls(B)`.
 
-        return cls(A)(state_join)
+        Binds are appended to the program of `st_a` and evaluated without
+        recursion, see :class:`Program`.
+        """
+        B = mf.tgt._value_
+        return cls(B)(st_a._program_.push("bind", mf), st_a._initial_)
 
     @classmethod
     def gets(cls, f):
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 from typing import Callable, Any
 from enum import Enum
 
@@ -51,6 +50,9 @@ class Constructor(Kind):
 
     arity = ...
 
+    # type cache class, see `utils.TypeCache`
+    Cache = utils.TypeCache
+
     class _defaults_:
 
         kind = "(*, ...) -> *"
@@ -116,7 +118,8 @@ class Constructor(Kind):
         """
         T = super().__new__(cls, name, (*bases, cls._defaults_), dct)
         # wrap T.__new__
-        T.__new__ = cls._cache_new_(Constructor._new_)
+        T._cache_ = cls.Cache(Constructor._new_)
+        T.__new__ = cls._cache_new_(Constructor._new_, T._cache_)
         return T
 
     def _eval_signature_(T, method) -> Type:
@@ -143,12 +146,29 @@ class Constructor(Kind):
             tail = ""
         return T.__name__ + " " + tail
 
+    def pin(T, *As: Any) -> Type:
+        """
+        Return `T(*As)`, never evicted from the type cache of `T`.
+        """
+        As = T._pre_new_(*As)
+        return T._cache_.pin(T, *As)
+
+    def unpin(T, *As: Any):
+        """
+        Release `T(*As)` to the bounded type cache of `T`.
+        """
+        As = T._pre_new_(*As)
+        T._cache_.unpin(T, *As)
+
     @classmethod
-    def _cache_new_(cls, new: Callable) -> Callable:
+    def _cache_new_(cls, new: Callable, cache: Callable | None = None) -> Callable:
         """
         Cached `Constructor.__new__`, compatible with subclass definitions.
+
+        Calls on hashable inputs are cached by `cache`, which defaults to a
+        bounded `Constructor.Cache` instance, see :class:`utils.TypeCache`.
         """
-        new_ = functools.cache(new)
+        new_ = cache if cache is not None else cls.Cache(new)
 
         def cached_new(cls, *xs, **ys):
             mode = _calling_mode(*xs, **ys)
@@ -247,6 +267,9 @@ class Var(Type, metaclass=Constructor):
 
     _accessors_ = None
 
+    # size of `match` and `substitute` memoization tables
+    _max_memo_ = 256
+
     class Object: ...
 
     @classmethod
@@ -263,45 +286,59 @@ class Var(Type, metaclass=Constructor):
 
     def match(A, B):
         """Matches `{"Ai": Type}` against a concrete type B."""
+        memo = A._memo_("_matches_")
+        try:
+            out = memo[B]
+        except KeyError:
+            out = A._match_(B)
+            if len(memo) < A._max_memo_:
+                memo[B] = out
+        except TypeError:
+            out = A._match_(B)
+        return dict(out) if out is not None else None
+
+    def _match_(A, B):
         # --- leaf node ---
         if A._tail_ is None:
             return {A.__name__: B}
         if not "_head_" in dir(B):
             return None
 
+        head, dots, code = A._compile_()
         out = {}
         # --- head of expression ---
-        if isinstance(A._head_, Var):
-            name = A._head_.__name__
-            out[name] = B._head_
+        if head is not None:
+            out[head] = B._head_
 
         # --- tail of expression ---
-
-        nA, nB = len(A._tail_), len(B._tail_)
+        nA, nB = len(code), len(B._tail_)
         n = 1 + nB - nA
 
         # Ellipsis
-        dots = Var("...")
         if nA == nB:
-            tail = A._tail_
-        elif dots == A._tail_[-1] and n >= 0:
-            ndots = [dots] * n
-            tail = (*A._tail_[:-1], *ndots)
-        elif dots == A._tail_[0] and n >= 0:
-            ndots = [dots] * n
-            tail = (*ndots, *A._tail_[1:])
+            pass
+        elif dots == -1 and n >= 0:
+            code = (*code[:-1], *[code[-1]] * n)
+        elif dots == 0 and n >= 0:
+            code = (*[code[0]] * n, *code[1:])
         else:
             return None
 
-        # Recursive matching on leaves
-        dots, dotsname = [], "..."
-        for Ai, Bi in zip(tail, B._tail_):
-            if isinstance(Ai, Var):
-                mi = Var.match(Ai, Bi)
+        # Matching on leaves
+        ellipsis, dotsname = [], "..."
+        for (op, Ai), Bi in zip(code, B._tail_):
+            if op == "dots":
+                ellipsis.append(Bi)
+            elif op == "bind":
+                name = Ai.__name__
+                if name not in out:
+                    out[name] = Bi
+                elif out[name] != Bi:
+                    return None
+            elif op == "match":
+                mi = Ai.match(Bi)
                 if mi == None:
                     return None
-                elif Ai.__name__ == "...":
-                    dots.append(Bi)
                 elif Ai.__name__ not in out:
                     out |= mi
                 elif out[Ai.__name__] != Bi:
@@ -310,13 +347,67 @@ class Var(Type, metaclass=Constructor):
                 return None
         while dotsname in out:
             dotsname += "."
-        out[dotsname] = tuple(dots)
+        out[dotsname] = tuple(ellipsis)
         return out
 
+    def _compile_(A) -> tuple[str | None, int | None, tuple[tuple[str, Type], ...]]:
+        """
+        Compile the pattern to a flat matcher `(head, dots, code)`.
+
+        The `head` is the name of a head type variable if any, `dots` the
+        position of an ellipsis in the tail (`0`, `-1` or `None`),
+        and `code` holds one `(op, Ai)` instruction per leaf `Ai` of the
+        tail, with `op` among `"dots"`, `"bind"`, `"match"` and `"eq"`.
+        """
+        compiled = A.__dict__.get("_compiled_")
+        if compiled is not None:
+            return compiled
+        head = A._head_.__name__ if isinstance(A._head_, Var) else None
+        code = []
+        for Ai in A._tail_:
+            if not isinstance(Ai, Var):
+                code.append(("eq", Ai))
+            elif Ai.__name__ == "...":
+                code.append(("dots", Ai))
+            elif Ai._tail_ is None:
+                code.append(("bind", Ai))
+            else:
+                code.append(("match", Ai))
+        dots = Var("...")
+        if len(code) and dots == A._tail_[-1]:
+            pos = -1
+        elif len(code) and dots == A._tail_[0]:
+            pos = 0
+        else:
+            pos = None
+        A._compiled_ = (head, pos, tuple(code))
+        return A._compiled_
+
+    def _memo_(A, name: str) -> dict:
+        """Memoization table owned by the pattern `A`."""
+        memo = A.__dict__.get(name)
+        if memo is None:
+            memo = {}
+            setattr(A, name, memo)
+        return memo
+
     def substitute(A, matches: dict[str, Type]) -> Type:
         """
         Concrete type obtained by substitution of matches.
         """
+        memo = A._memo_("_substitutes_")
+        try:
+            key = frozenset(matches.items())
+            return memo[key]
+        except KeyError:
+            SA = A._substitute_(matches)
+            if len(memo) < A._max_memo_:
+                memo[key] = SA
+            return SA
+        except TypeError:
+            return A._substitute_(matches)
+
+    def _substitute_(A, matches: dict[str, Type]) -> Type:
         if A._tail_ is None:
             name = A.__name__.split(":")[0]
             SA = matches[name]
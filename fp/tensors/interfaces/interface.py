@@ -55,11 +55,15 @@ class Interface:
             cast methods, e.g. `"module"` or `"Array"`.
         repeat (str): name of `"repeat"` method (`"repeat_interleave"` for torch)
         tile (str): name of `"tile"` method (`"repeat"` for torch)
+        sparse_coo (callable): sparse matrix constructor, from indices of
+            shape `(2, nnz)`, values of shape `(nnz,)` and a shape, e.g.
+            `scipy.sparse.coo_array` for numpy.
     """
 
     module: ModuleType
     Array: type
     asarray: Callable
+    sparse_coo: Callable
     dtypes: DtypeTable = DtypeTable()
     dtypes_bind: str = "module"
     # aliases
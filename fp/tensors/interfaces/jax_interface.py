@@ -7,12 +7,20 @@ try:
 
     HAS_JAX = True
 
+    def sparse_coo(indices, values, shape):
+        """Sparse `jax.experimental.sparse.BCOO` matrix."""
+        from jax.experimental.sparse import BCOO
+
+        indices = jax.numpy.asarray(indices).T
+        return BCOO((jax.numpy.asarray(values), indices), shape=tuple(shape))
+
     @struct
     class JaxInterface(Interface):
         module = jax.numpy
         # array class and constructor
         Array = jax.numpy.ndarray
         asarray = jax.numpy.asarray
+        sparse_coo = sparse_coo
         # dtypes : jax.numpy.<dtype>(x)
         dtypes = DtypeTable()
         dtypes_bind = "module"
@@ -6,6 +6,14 @@ from .interface import Interface, DtypeTable, INTERFACES
 import numpy as np
 
 
+def sparse_coo(indices, values, shape):
+    """Sparse `scipy.sparse.coo_array` matrix."""
+    import scipy.sparse
+
+    i, j = np.asarray(indices)
+    return scipy.sparse.coo_array((np.asarray(values), (i, j)), shape=tuple(shape))
+
+
 @struct
 class NumpyInterface(Interface):
 
@@ -13,6 +21,7 @@ class NumpyInterface(Interface):
 
     Array = np.ndarray
     asarray = np.asarray
+    sparse_coo = sparse_coo
     # dtypes: np.<dtype>(x)
     dtypes = DtypeTable()
     dtypes_bind = "module"
@@ -24,6 +24,7 @@ try:
         # array class and constructor
         Array = torch.Tensor
         asarray = torch.as_tensor
+        sparse_coo = torch.sparse_coo_tensor
         # dtypes : torch.Tensor.<alias>(x)
         dtypes = DtypeTableTorch()
         dtypes_bind = "Array"
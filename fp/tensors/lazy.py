@@ -0,0 +1,184 @@
+"""
+Lazy matrices, applied without being materialized.
+
+Lazy matrices have the `"lazy"` layout, see :func:`sparse.layout`. They
+support products `M @ X` with dense vectors or matrices `X`, transposition
+`M.T`, and are only computed by :meth:`LazyMatrix.materialize`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from . import sparse
+from .interfaces import INTERFACES, torch
+
+
+class LazyMatrix:
+    """Base class of lazy matrices."""
+
+    layout = "lazy"
+
+    shape: tuple[int, int]
+
+    def __matmul__(self, other):
+        if isinstance(other, LazyMatrix) or sparse.is_sparse(other):
+            return Product.of(self, other)
+        return self.matvec(other)
+
+    def __rmatmul__(self, other):
+        return Product.of(other, self)
+
+    def matvec(self, X):
+        """Product with a vector of shape `(M,)` or matrix of shape `(M, k)`."""
+        ...
+
+    def materialize(self, fmt: str | None = None):
+        """Compute the matrix, in storage format `fmt` if given."""
+        ...
+
+    @property
+    def dtype(self):
+        return self.factors[0].dtype
+
+    @property
+    def nbytes(self):
+        return sum(sparse.nbytes(M) for M in self.factors)
+
+
+def _matmul(A, B):
+    """Product of two matrices, lazy if any of them is."""
+    if isinstance(A, LazyMatrix) or isinstance(B, LazyMatrix):
+        return Product.of(A, B)
+    if sparse.is_sparse(A) and sparse.is_sparse(B):
+        fmt = sparse.spmv_format(A)
+        return sparse.convert(A, fmt) @ sparse.convert(B, fmt)
+    return A @ B
+
+
+class Kron(LazyMatrix):
+    """
+    Kronecker product `F ⊗ G` of two matrices.
+
+    For `F` of shape `(Nf, Mf)` and `G` of shape `(Ng, Mg)`, the product
+    with a vector `x` of shape `(Mf * Mg,)` is computed as `F X Gᵀ`, for
+    `X = x.reshape(Mf, Mg)`, in `O(Nf Mf Mg + Nf Mg Ng)` operations and
+    without storing the `(Nf Ng, Mf Mg)` matrix.
+    """
+
+    def __init__(self, F, G):
+        self.F, self.G = F, G
+        self.factors = (F, G)
+        (Nf, Mf), (Ng, Mg) = F.shape, G.shape
+        self.shape = (Nf * Ng, Mf * Mg)
+
+    def matvec(self, X):
+        (Nf, Mf), (Ng, Mg) = self.F.shape, self.G.shape
+        k = tuple(X.shape[1:])
+        X = X.reshape((Mf, Mg, -1))
+        # apply G on the second axis
+        Y = self.G @ X.swapaxes(0, 1).reshape((Mg, -1))
+        Y = Y.reshape((Ng, Mf, -1)).swapaxes(0, 1)
+        # apply F on the first axis
+        Y = self.F @ Y.reshape((Mf, -1))
+        return Y.reshape((Nf * Ng, *k))
+
+    @property
+    def T(self):
+        return Kron(sparse.transpose(self.F), sparse.transpose(self.G))
+
+    def materialize(self, fmt=None):
+        F, G = self.F, self.G
+        if isinstance(F, LazyMatrix):
+            F = F.materialize()
+        if isinstance(G, LazyMatrix):
+            G = G.materialize()
+        out = kron(F, G)
+        return out if fmt is None else sparse.convert(out, fmt)
+
+    def __repr__(self):
+        return f"Kron({self.shape[0]}x{self.shape[1]})"
+
+
+class Product(LazyMatrix):
+    """
+    Product `M1 @ M2 @ ... @ Mn` of matrices, applied right to left.
+
+    Adjacent Kronecker products of matching shapes are multiplied
+    factor-wise, `(F1 ⊗ G1)(F2 ⊗ G2) = F1 F2 ⊗ G1 G2`, see :meth:`of`.
+    """
+
+    def __init__(self, *factors):
+        self.factors = factors
+        self.shape = (factors[0].shape[0], factors[-1].shape[1])
+
+    @classmethod
+    def of(cls, *Ms):
+        """Lazy product of matrices, simplifying Kronecker products."""
+        factors = []
+        for M in Ms:
+            factors.extend(M.factors if isinstance(M, Product) else (M,))
+        out = [factors[0]]
+        for M in factors[1:]:
+            L = out[-1]
+            if (
+                isinstance(L, Kron)
+                and isinstance(M, Kron)
+                and L.F.shape[1] == M.F.shape[0]
+                and L.G.shape[1] == M.G.shape[0]
+            ):
+                out[-1] = Kron(_matmul(L.F, M.F), _matmul(L.G, M.G))
+            else:
+                out.append(M)
+        return out[0] if len(out) == 1 else cls(*out)
+
+    def matvec(self, X):
+        for M in reversed(self.factors):
+            X = M.matvec(X) if isinstance(M, LazyMatrix) else M @ X
+        return X
+
+    @property
+    def T(self):
+        return Product(*(sparse.transpose(M) for M in reversed(self.factors)))
+
+    def materialize(self, fmt=None):
+        out = None
+        for M in self.factors:
+            M = M.materialize() if isinstance(M, LazyMatrix) else M
+            out = M if out is None else _matmul(out, M)
+        return out if fmt is None else sparse.convert(out, fmt)
+
+    def __repr__(self):
+        return " @ ".join(repr(M) for M in self.factors)
+
+
+def kron(F, G):
+    """
+    Materialized Kronecker product of two matrices.
+
+    The product is sparse (COO) if any of `F` or `G` is.
+    """
+    api = INTERFACES[sparse.backend(F)]
+    if not (sparse.is_sparse(F) or sparse.is_sparse(G)):
+        return api.module.kron(F, G)
+    if sparse.is_scipy(F) or sparse.is_scipy(G):
+        return sparse.scipy.sparse.kron(F, G, format="coo")
+    Nf, Mf = F.shape
+    Ng, Mg = G.shape
+    shape = [Nf * Ng, Mf * Mg]
+    if not sparse.is_torch(F):
+        # tensor product on numpy COO indices
+        (ij, Vf), (ab, Vg) = sparse.coo(F), sparse.coo(G)
+        XY = np.array([Ng, Mg])[:, None] * ij.repeat(ab.shape[1], 1)
+        XY = XY + np.tile(ab, (1, ij.shape[1]))
+        val = Vf.repeat(Vg.shape[0]) * np.tile(Vg, Vf.shape[0])
+        return api.sparse_coo(XY, val, shape)
+    # sparse tensor product on torch COO indices
+    F, G = sparse.convert(F, "coo"), sparse.convert(G, "coo")
+    ij, ab = F.indices(), G.indices()
+    Vf, Vg = F.values(), G.values()
+    IJ = ij.repeat_interleave(ab.shape[1], 1)
+    AB = ab.repeat(1, ij.shape[1])
+    XY = torch.tensor([Ng, Mg])[:, None] * IJ + AB
+    val = Vf.repeat_interleave(Vg.shape[0], 0) * Vg.repeat(Vf.shape[0])
+    return torch.sparse_coo_tensor(XY, val, shape, device=F.device)
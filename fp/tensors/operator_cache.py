@@ -0,0 +1,135 @@
+import hashlib
+import os
+from collections import OrderedDict, namedtuple
+from typing import Callable, Hashable
+
+import numpy as np
+
+from . import sparse
+from .interfaces import INTERFACES
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "loads", "evictions", "maxbytes", "currbytes", "currsize"],
+)
+
+
+class OperatorCache:
+    """
+    Bounded cache of linear operators.
+
+    Operators such as `Tens(A).embed(*ds)` are computed once per key,
+    e.g. `("embed", A, ds)`, and held in a LRU table until the memory
+    used by their matrices exceeds `maxbytes`.
+
+    If a `path` directory is given, sparse operators are also persisted
+    as `.npz` files and read back on misses, e.g. by later processes, in
+    the same backend and storage format.
+
+    Example:
+    --------
+    .. code::
+
+        >>> p1 = Tens((2, 3)).proj(1)
+        >>> p1 = Tens((2, 3)).proj(1)
+        >>> Tens.operators.cache_info()
+        CacheInfo(hits=1, misses=2, loads=0, evictions=0, maxbytes=268435456, currbytes=240, currsize=2)
+    """
+
+    maxbytes: int = 1 << 28
+
+    def __init__(self, maxbytes: int | None = None, path: str | None = None):
+        self.maxbytes = maxbytes if maxbytes is not None else self.maxbytes
+        self.path = path
+        self.hits = self.misses = self.loads = self.evictions = 0
+        self.currbytes = 0
+        self._lru = OrderedDict()
+
+    def __call__(self, key: Hashable, compute: Callable, *xs):
+        """Return the operator `compute(*xs)`, cached on `key`."""
+        if key in self._lru:
+            self.hits += 1
+            self._lru.move_to_end(key)
+            return self._lru[key][0]
+        op = self._load(key) if self.path is not None else None
+        if op is not None:
+            self.loads += 1
+        else:
+            self.misses += 1
+            op = compute(*xs)
+            if self.path is not None:
+                self._save(key, op)
+        self._push(key, op)
+        return op
+
+    def _push(self, key, op):
+        size = sparse.nbytes(op.data)
+        self._lru[key] = (op, size)
+        self.currbytes += size
+        while self.currbytes > self.maxbytes and len(self._lru) > 1:
+            _, (_, size) = self._lru.popitem(last=False)
+            self.currbytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all operators held in memory."""
+        self._lru.clear()
+        self.currbytes = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics, as `functools.lru_cache` does."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.loads,
+            self.evictions,
+            self.maxbytes,
+            self.currbytes,
+            len(self._lru),
+        )
+
+    # --- persistence ---
+
+    def _file(self, key) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        return os.path.join(self.path, f"{digest}.npz")
+
+    def _save(self, key, op):
+        mat = op.data
+        if sparse.layout(mat) not in ("coo", "csr", "csc"):
+            return
+        os.makedirs(self.path, exist_ok=True)
+        A, B = type(op)._tail_
+        indices, values = sparse.coo(mat)
+        np.savez(
+            self._file(key),
+            key=repr(key),
+            src=A,
+            tgt=B,
+            backend=sparse.backend(mat),
+            layout=sparse.layout(mat),
+            shape=tuple(mat.shape),
+            indices=indices,
+            values=values,
+        )
+
+    def _load(self, key):
+        file = self._file(key)
+        if not os.path.exists(file):
+            return None
+        from .tens import Linear
+
+        with np.load(file) as npz:
+            if str(npz["key"]) != repr(key):
+                return None
+            api = INTERFACES[str(npz["backend"])]
+            mat = api.sparse_coo(
+                api.asarray(npz["indices"]),
+                api.asarray(npz["values"]),
+                tuple(int(n) for n in npz["shape"]),
+            )
+            if sparse.is_torch(mat):
+                mat = mat.coalesce()
+            mat = sparse.convert(mat, str(npz["layout"]))
+            A, B = (tuple(int(n) for n in npz[k]) for k in ("src", "tgt"))
+        return Linear(A, B)(mat)
@@ -1,35 +1,91 @@
-import torch
+import itertools
+import math
+import operator
+
 from fp import utils
 from fp.meta import Functor
 from fp.cartesian import Type, Hom
 from fp.base import Int, List, Ring
 from .tensor import Tensor
 from .backend import Backend
+from .interfaces import Interface, INTERFACES
+
+
+def _interface_of(data) -> Interface:
+    """Interface of the backend owning an array."""
+    for api in INTERFACES.values():
+        if isinstance(data, api.Array):
+            return api
+    return INTERFACES["numpy"]
+
+
+def _data(x):
+    """Array of a tensor, or raw array (e.g. within composed index maps)."""
+    return x.data if isinstance(x, Tensor) else x
+
+
+def _dtype_name(data) -> str:
+    return str(data.dtype).split(".")[-1]
+
+
+# integer dtypes preserved by shape casts, others are cast to int64
+_index_dtypes = ("int32", "int64")
+
+
+def _strides(ns: tuple[int, ...]) -> tuple[int, ...]:
+    """Row-major strides of a shape."""
+    if not len(ns):
+        return ()
+    return tuple(itertools.accumulate((1, *ns[:0:-1]), operator.mul))[::-1]
 
 
 class BaseShape(Tensor):
 
     d = 1
-    n = [1]
-    ns = torch.tensor([1])
+    n = (1,)
+    ns = (1,)
 
-    mod = torch.tensor([1])
-    rmod = torch.tensor([1])
+    mod = (1,)
+    rmod = (1,)
     size = 1
 
     def __iter__(self):
         return self.data.__iter__()
 
+    @classmethod
+    def _codec_(cls, data) -> tuple:
+        """
+        Strides and sizes as arrays of the backend and dtype of `data`.
+
+        Cached by (array type, dtype) on the shape type.
+        """
+        key = (type(data), data.dtype)
+        codec = cls._codecs_.get(key)
+        if codec is None:
+            asarray = _interface_of(data).module.asarray
+            mod = asarray(cls.mod, dtype=data.dtype)
+            ns = asarray(cls.ns, dtype=data.dtype)
+            codec = cls._codecs_[key] = (mod, ns)
+        return codec
+
     @classmethod
     def cast(cls, js):
-        if isinstance(js, Tensor):
-            return cls.cast(js.data)
-        t = (
-            js.long()
-            if isinstance(js, torch.Tensor)
-            else torch.tensor(js, dtype=torch.long)
-        )
-        return cls(t % cls.ns)
+        """
+        Cast integer coordinates, modulo the shape.
+
+        Arrays of int32 or int64 dtypes keep their dtype and backend,
+        other inputs are cast to int64. Values of flat shapes are read
+        as indices, of any batch shape.
+        """
+        data = _data(js)
+        if not hasattr(data, "dtype"):
+            data = cls._interface_.asarray(data)
+        if _dtype_name(data) not in _index_dtypes:
+            data = _interface_of(data).dtype_cast("int64")(data)
+        if cls.dim <= 1:
+            return cls(data % cls.size)
+        mod, ns = cls._codec_(data)
+        return cls(data % ns)
 
     @classmethod
     def index(cls, js):
@@ -37,42 +93,25 @@ class BaseShape(Tensor):
 
             Tens d Long -> Tens 1 Long
 
-        If a 2D tensor is given as coordinates,
-        the first dimension is understood as batch
-        dimension.
+        Coordinates are read on the last dimension of `js`, leading
+        dimensions are understood as batch dimensions.
         """
-        js = js.data
-        if not len(js):
-            return 0
-        j0 = js[0]
-        js = j0 if j0.dim() > 1 else js
-        return (cls.mod * js).sum([-1])
+        js = _data(js)
+        mod, ns = cls._codec_(js)
+        return (js * mod).sum(-1, dtype=js.dtype)
 
     @classmethod
     def coords(cls, i):
         """Returns coordinates of row-major index.
 
-        Tens 1 Long -> Tens d Long
+            Tens 1 Long -> Tens d Long
+
+        Indices of any batch shape `(...)` are mapped to coordinates of
+        shape `(..., d)` by a single broadcasted division.
         """
-        if isinstance(i, int):
-            if i >= cls.size or i < 0:
-                raise IndexError(f"{cls} coords {i}")
-
-        div = lambda a, b: torch.div(a, b, rounding_mode="floor")
-
-        i = i.data
-        if i.dim() == 0:
-            out = torch.zeros([cls.dim], dtype=torch.long)
-            for j, mj in enumerate(cls.mod):
-                out[j] = div(i, mj)
-                i = i % mj
-            return out
-
-        out = []
-        for j, mj in enumerate(cls.mod):
-            out += div(i[None, :], mj)
-            i = i % mj
-        return torch.stack(out).t() if len(out) else torch.tensor([[]])
+        i = _data(i)
+        mod, ns = cls._codec_(i)
+        return i[..., None] // mod % ns
 
     @classmethod
     def p(cls, d):
@@ -81,8 +120,8 @@ class BaseShape(Tensor):
 
             Tens d Long -> Tens 1 Long
         """
-        tgt = Torus([cls.n[d]])
-        proj_d = Hom(cls, tgt)(lambda x: x.data.select(-1, d))
+        tgt = Torus((cls.n[d],))
+        proj_d = Hom(cls, tgt)(lambda x: _data(x)[..., d])
         proj_d.__name__ = f"p{d}"
         return proj_d
 
@@ -93,15 +132,14 @@ class BaseShape(Tensor):
 
             Tens d Long -> Tens (d-k) Long
         """
-        if not isinstance(ds, torch.Tensor):
-            ds = torch.tensor(ds, dtype=torch.long)
-        tgt = Torus([cls.n[d] for d in ds])
+        ds = [int(d) for d in ds]
+        tgt = Torus(tuple(cls.n[d] for d in ds))
 
         @Hom(cls, tgt)
         def res_ds(x):
-            return x.data.index_select(-1, ds)
+            return _data(x)[..., ds]
 
-        res_ds.__name__ = f'res {".".join(str(int(d)) for d in ds)}'
+        res_ds.__name__ = f'res {".".join(str(d) for d in ds)}'
         return res_ds
 
     @classmethod
@@ -111,15 +149,15 @@ class BaseShape(Tensor):
 
             Tens (d-k) Long -> Tens d Long
         """
-        src = Torus([cls.n[d] for d in ds])
-        mat = torch.zeros([cls.dim, len(ds)], dtype=torch.long)
-        for i, d in enumerate(ds):
-            mat[d, i] = 1
+        ds = [int(d) for d in ds]
+        src = Torus(tuple(cls.n[d] for d in ds))
+        mod = tuple(cls.mod[d] for d in ds)
 
         @Hom(src, cls)
         def emb_index(x):
-            y = mat @ x if x.dim() == 1.0 else (mat @ x.T).T
-            return int(cls.index(y))
+            x = _data(x)
+            i = (x * _interface_of(x).module.asarray(mod, dtype=x.dtype)).sum(-1)
+            return cls.coords(i)
 
         return emb_index
 
@@ -138,30 +176,32 @@ class Torus(Backend, Ring, metaclass=Functor):
         utils.log(("Torus new", TA, type(TA), type(TA) is cls), v=1)
         return TA
 
-        # new shape instance
-        if isinstance(A, type(None)):
-            A = ()
-        if not all(isinstance(ni, (int, torch.LongTensor)) for ni in A):
-            raise TypeError("Expecting integer arguments")
-        return super().new(A, (cls.Object,), {})
+    @classmethod
+    def _pre_new_(cls, A):
+        """Parse shapes to hashable tuples of integers."""
+        if A is None:
+            return ((),)
+        if isinstance(A, int):
+            return ((A,),)
+        try:
+            return (tuple(operator.index(ni) for ni in A),)
+        except TypeError:
+            raise TypeError(f"Expecting integer arguments, got {A}")
 
     def _post_new_(SA, A):
         dim = len(A)
-        TA = torch.tensor(A)
         # attributes
-        SA.dim = len(A)
-        SA.n = tuple(A)
-        SA.ns = torch.tensor(A)
+        SA.dim = dim
+        SA.n = A
+        SA.ns = A
         SA.shape = SA.n
-        SA.mod = torch.tensor([torch.prod(TA[i + 1 :]) for i in range(dim)])
-        SA.rmod = torch.tensor([torch.prod(TA[:-i]) for i in range(dim)])
-
-        size = 1
-        for ni in A:
-            size *= ni
-        SA.size = size
+        SA.mod = _strides(A)
+        SA.rmod = tuple(math.prod(A[:-i]) for i in range(dim))
+        SA.size = math.prod(A)
+        # index arrays by backend and dtype, see `BaseShape._codec_`
+        SA._codecs_ = {}
 
-        flat = Torus((SA.size,)) if SA.dim > 1 else SA
+        flat = Torus((SA.size,)) if SA.dim != 1 else SA
         SA.index = Hom(SA, flat)(SA.index)
         SA.coords = Hom(flat, SA)(SA.coords)
         return SA
@@ -0,0 +1,185 @@
+"""
+Storage formats of dense and sparse matrices.
+
+Matrices are either torch tensors, of strided, `sparse_coo`, `sparse_csr`
+or `sparse_csc` layouts, numpy arrays and `scipy.sparse` arrays, or jax
+arrays and `jax.experimental.sparse` arrays (BCOO and BCSR).
+Their format is read by :func:`layout` as one of:
+
+* `"dense"`: strided array,
+* `"coo"`: coordinate lists, suited to construction and tensor products,
+* `"csr"`: compressed rows, suited to matrix-vector products,
+* `"csc"`: compressed columns, the transpose of `"csr"` matrices,
+* `"lazy"`: matrices computed on application, see :mod:`fp.tensors.lazy`.
+"""
+
+import numpy as np
+
+from .interfaces import HAS_TORCH, torch, HAS_JAX, jax
+
+try:
+    import scipy.sparse
+
+    HAS_SCIPY = True
+
+except ModuleNotFoundError:
+    scipy = None
+    HAS_SCIPY = False
+
+if HAS_JAX:
+    from jax.experimental import sparse as jsparse
+
+
+LAYOUTS = ("dense", "coo", "csr", "csc", "lazy")
+
+if HAS_TORCH:
+    _torch_layouts = {
+        torch.strided: "dense",
+        torch.sparse_coo: "coo",
+        torch.sparse_csr: "csr",
+        torch.sparse_csc: "csc",
+    }
+
+
+def is_scipy(mat) -> bool:
+    return HAS_SCIPY and scipy.sparse.issparse(mat)
+
+
+def is_torch(mat) -> bool:
+    return HAS_TORCH and isinstance(mat, torch.Tensor)
+
+
+def is_jax(mat) -> bool:
+    return HAS_JAX and isinstance(mat, (jax.Array, jsparse.JAXSparse))
+
+
+def backend(mat) -> str:
+    """Name of the backend owning a matrix, a key of `INTERFACES`."""
+    if is_torch(mat):
+        return "torch"
+    return "jax" if is_jax(mat) else "numpy"
+
+
+def layout(mat) -> str:
+    """Storage format of a matrix, see :data:`LAYOUTS`."""
+    if is_torch(mat):
+        return _torch_layouts[mat.layout]
+    if is_jax(mat):
+        if isinstance(mat, jsparse.BCOO):
+            return "coo"
+        return "csr" if isinstance(mat, jsparse.BCSR) else "dense"
+    if is_scipy(mat):
+        return mat.format if mat.format in LAYOUTS else "coo"
+    if getattr(mat, "layout", None) == "lazy":
+        return "lazy"
+    return "dense"
+
+
+def is_sparse(mat) -> bool:
+    return layout(mat) != "dense"
+
+
+def spmv_format(mat) -> str:
+    """
+    Sparse format of matrix-vector products.
+
+    Compressed rows for torch and scipy, and BCOO for jax, whose BCSR
+    matrices cannot be transposed.
+    """
+    return "coo" if is_jax(mat) else "csr"
+
+
+def convert(mat, fmt: str):
+    """Convert a matrix to the storage format `fmt`."""
+    if layout(mat) == fmt:
+        return mat
+    if layout(mat) == "lazy":
+        return mat.materialize(fmt)
+    if is_torch(mat):
+        if fmt == "dense":
+            return mat.to_dense()
+        if fmt == "coo":
+            return mat.to_sparse().coalesce()
+        if fmt == "csr":
+            return mat.to_sparse_csr()
+        if fmt == "csc":
+            return mat.to_sparse_csc()
+    elif is_jax(mat):
+        if fmt == "dense":
+            return mat.todense()
+        if fmt == "coo":
+            if layout(mat) == "csr":
+                return mat.to_bcoo()
+            return jsparse.BCOO.fromdense(mat)
+        if fmt == "csr":
+            return jsparse.BCSR.from_bcoo(convert(mat, "coo"))
+    elif is_scipy(mat):
+        return mat.toarray() if fmt == "dense" else mat.asformat(fmt)
+    elif fmt in ("coo", "csr", "csc"):
+        return scipy.sparse.coo_array(np.asarray(mat)).asformat(fmt)
+    raise ValueError(f"Unknown matrix format {fmt}")
+
+
+def transpose(mat):
+    """
+    Transpose a matrix.
+
+    Compressed formats are transposed without copies, rows of `"csr"`
+    matrices being columns of `"csc"` matrices.
+    """
+    if is_torch(mat):
+        return mat.t().coalesce() if mat.layout == torch.sparse_coo else mat.t()
+    if is_jax(mat) and layout(mat) == "csr":
+        return mat.to_bcoo().T
+    return mat.T
+
+
+def nnz(mat) -> int:
+    """Number of stored values."""
+    if is_torch(mat):
+        return mat._nnz() if mat.layout != torch.strided else mat.numel()
+    if is_scipy(mat):
+        return mat.nnz
+    if is_jax(mat) and is_sparse(mat):
+        return mat.nse
+    return mat.size
+
+
+def arrays(mat) -> tuple:
+    """Arrays holding the values and indices of a matrix."""
+    fmt = layout(mat)
+    if is_torch(mat):
+        if fmt == "coo":
+            mat = mat.coalesce()
+            return (mat.indices(), mat.values())
+        if fmt == "csr":
+            return (mat.crow_indices(), mat.col_indices(), mat.values())
+        if fmt == "csc":
+            return (mat.ccol_indices(), mat.row_indices(), mat.values())
+        return (mat,)
+    if is_scipy(mat):
+        if fmt == "coo":
+            return (*mat.coords, mat.data)
+        return (mat.indptr, mat.indices, mat.data)
+    if is_jax(mat) and fmt == "csr":
+        return (mat.indptr, mat.indices, mat.data)
+    if is_jax(mat) and fmt == "coo":
+        return (mat.indices, mat.data)
+    return (mat,)
+
+
+def coo(mat) -> tuple:
+    """Indices of shape `(2, nnz)` and values of a sparse matrix, as numpy arrays."""
+    mat = convert(mat, "coo")
+    if is_torch(mat):
+        return mat.indices().numpy(), mat.values().numpy()
+    if is_jax(mat):
+        return np.asarray(mat.indices).T, np.asarray(mat.data)
+    return np.stack(mat.coords), mat.data
+
+
+def nbytes(mat) -> int:
+    """Memory held by a dense or sparse matrix."""
+    if is_torch(mat):
+        return sum(a.element_size() * a.numel() for a in arrays(mat))
+    return sum(int(getattr(a, "nbytes", 0)) for a in arrays(mat))
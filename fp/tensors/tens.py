@@ -1,8 +1,10 @@
-import torch
+import math
 
 from .tensor import Tensor, Backend
 from .tens_base import TensBase
 from .shape import Torus
+from .operator_cache import OperatorCache
+from . import sparse, lazy
 
 from fp.meta import HomFunctor, Functor, NFunctor
 from fp.cartesian import Type, Hom
@@ -11,7 +13,7 @@ import fp.utils as utils
 
 from .tensor import Tensor
 from .backend import Backend
-from .interfaces import StatefulInterface
+from .interfaces import StatefulInterface, torch
 
 StatefulBackend = Backend(StatefulInterface.mock())
 
@@ -34,6 +36,9 @@ class Tens(Backend, metaclass=Functor):
 
     _Array_ = Tensor._Array_
 
+    # embeddings and projections, see `TensBase.embed`
+    operators = OperatorCache()
+
     class Object(TensBase): ...
 
     @classmethod
@@ -60,12 +65,21 @@ class Tens(Backend, metaclass=Functor):
 
     @classmethod
     def cofmap(cls, f, batch=True):
+        """
+        Pullback of an index map `f : Torus A -> Torus B`.
+
+        Returns the sparse matrix in `Linear(B, A)` with ones at `(i, f(i))`,
+        in the sparse format of the current backend, see `Interface.sparse_coo`.
+        """
         ns, ms = f.src.n, f.tgt.n
         g = f.tgt.index @ f @ f.src.coords
-        i = torch.arange(f.src.size)
-        j = g(i) if batch else [g(ik) for ik in i]
-        ij = torch.stack([i.data, j.data])
-        mat = Tensor.sparse([g.src.size, g.tgt.size], ij)
+        api = StatefulInterface._initial_
+        xp = api.module
+        i = xp.arange(f.src.size)
+        j = g(i) if batch else xp.stack([g(ik).data for ik in i])
+        j = j.data if isinstance(j, Tensor) else j
+        ij = xp.stack([i, j.reshape(-1)])
+        mat = api.sparse_coo(ij, xp.ones(f.src.size), [g.src.size, g.tgt.size])
         return Linear(ms, ns)(mat)
 
     def __str__(TA):
@@ -105,40 +119,88 @@ class Linear(Hom, Tens, metaclass=HomFunctor):
             cls = self.__class__
             # Tens([B, A]) attributes
             mat = matrix.data if isinstance(matrix, Tensor) else matrix
-            if mat.is_sparse:
+            fmt = sparse.layout(mat)
+            if fmt == "coo" and sparse.is_torch(mat):
                 mat = mat.coalesce()
             self.data = mat
+            # matrices by storage format, see `asformat`
+            self._formats_ = {fmt: mat}
 
             # Hom(Tens([A]), Tens([B])) attributes
+            self._pipe = (lambda x: cls.matvec(self, x),)
             A, B = ("x".join(str(n) for n in C) for C in self._tail_)
-            if mat.is_sparse:
-                nnz = mat.indices().shape[-1]
-                self.__name__ = f"sparse {B}<{A} (nnz={nnz})"
+            if name is not None:
+                self.__name__ = name
+            elif fmt == "lazy":
+                self.__name__ = f"lazy {B}<{A}"
+            elif fmt != "dense":
+                nnz = sparse.nnz(mat)
+                kind = "sparse" if fmt == "coo" else fmt
+                self.__name__ = f"{kind} {B}<{A} (nnz={nnz})"
             else:
                 self.__name__ = f"dense {B}<{A}"
 
+        @property
+        def layout(self) -> str:
+            """Storage format of the matrix, see :data:`sparse.LAYOUTS`."""
+            return sparse.layout(self.data)
+
+        def asformat(self, fmt: str):
+            """
+            Matrix in the storage format `fmt`.
+
+            Conversions are computed once and cached on the operator.
+            """
+            mat = self._formats_.get(fmt)
+            if mat is None:
+                mat = self._formats_[fmt] = sparse.convert(self.data, fmt)
+            return mat
+
+        def _spmv_(self):
+            """Matrix used for products on the right, see `sparse.spmv_format`."""
+            if self.layout in ("dense", "lazy"):
+                return self.data
+            return self.asformat(sparse.spmv_format(self.data))
+
+        def materialize(self, fmt: str | None = None):
+            """
+            Operator holding the computed matrix of a lazy operator.
+
+            The storage format defaults to COO for products of sparse
+            matrices, and to dense arrays otherwise.
+            """
+            if self.layout != "lazy":
+                return self if fmt is None else self.__class__(self.asformat(fmt))
+            mat = self.data.materialize(fmt)
+            return self.__class__(mat)
+
         @classmethod
         def matvec(cls, mat, x):
             """Matrix vector product."""
-            if isinstance(x, (Tensor, torch.Tensor)):
+            if isinstance(x, Tensor):
+                x = x.data
+            if hasattr(x, "shape"):
                 sx = list(x.shape)
                 src = list(cls.src.shape)
-                M, X = mat.data, x.data
+                M = mat._spmv_() if isinstance(mat, Linear.Object) else mat.data
+                X = x
                 # cast dtype
-                if torch.is_complex(M) and not torch.is_complex(X):
-                    X = X.complex()
-                if M.is_floating_point() and not X.is_floating_point():
-                    X = X.float()
+                dtype = getattr(M, "dtype", None)
+                if sparse.is_torch(X) and isinstance(dtype, torch.dtype):
+                    if dtype.is_complex and not torch.is_complex(X):
+                        X = X.complex()
+                    if dtype.is_floating_point and not X.is_floating_point():
+                        X = X.float()
                 # apply to 1d vector
                 if sx == [cls.src.domain.size]:
                     return M @ X
                 # apply to tensor
                 elif sx == src:
-                    return M @ X.view([-1])
+                    return M @ X.reshape([-1])
                 # apply to last dimensions of tensor
                 elif sx[-len(src) :] == src:
                     n1 = cls.src.domain.size
-                    xT = X.view([-1, n1]).T
+                    xT = X.reshape([-1, n1]).T
                     return (M @ xT).T
                 raise TypeError(f"Did not find a caller for input {x.shape}")
 
@@ -147,7 +209,7 @@ class Linear(Hom, Tens, metaclass=HomFunctor):
                 return self.__class__(
                     self.data * other, name=f"{other} * {self.__name__}"
                 )
-            if isinstance(other, torch.Tensor) and other.numel() == 1:
+            if hasattr(other, "shape") and math.prod(other.shape) == 1:
                 return self.__class__(
                     self.data * other, name=f"{other} * {self.__name__}"
                 )
@@ -156,14 +218,24 @@ class Linear(Hom, Tens, metaclass=HomFunctor):
         def __rmul__(self, other):
             if isinstance(other, (int, float)):
                 return self.__mul__(other)
-            if isinstance(other, torch.Tensor) and other.numel() == 1:
+            if hasattr(other, "shape") and math.prod(other.shape) == 1:
                 return self.__mul__(other)
             return super().__rmul__(other)
 
         def t(self):
-            """Adjoint operator in Linear(B, A)."""
+            """
+            Adjoint operator in Linear(B, A).
+
+            Cached formats are transposed along, compressed rows becoming
+            compressed columns without copies.
+            """
             A, B = self._tail_
-            return Linear(B, A)(self.data.t())
+            transposed = {"csr": "csc", "csc": "csr"}
+            tf = Linear(B, A)(sparse.transpose(self.data))
+            for fmt, mat in self._formats_.items():
+                fmt = transposed.get(fmt, fmt)
+                tf._formats_.setdefault(fmt, sparse.transpose(mat))
+            return tf
 
         def __repr__(self):
             return self.__name__
@@ -214,9 +286,19 @@ class Linear(Hom, Tens, metaclass=HomFunctor):
         g = gs[0]
         if len(gs) > 1:
             return cls.compose(cls.compose(f, g), *gs[1:])
-        """Composition of matrices."""
-        if f.data.is_sparse and g.data.is_sparse:
-            data = torch.sparse.mm(g.data, f.data)
+        """Composition of matrices.
+
+        Sparse factors are multiplied in CSR format, the product of two
+        sparse matrices being sparse. Compositions with lazy operators are
+        lazy, see :class:`lazy.Product`.
+        """
+        if g.layout == "lazy" or f.layout == "lazy":
+            data = lazy.Product.of(g._spmv_(), f._spmv_())
+        elif g.layout != "dense":
+            data = g._spmv_() @ f._spmv_()
+        elif f.layout != "dense":
+            # (G F)^T = F^T G^T, with F^T in CSR format
+            data = sparse.transpose(f.t()._spmv_() @ g.data.T)
         else:
             data = g.data @ f.data
         gf = cls(f.src, g.tgt)(data)
@@ -251,35 +333,16 @@ class Linear(Hom, Tens, metaclass=HomFunctor):
 
     @classmethod
     def otimes(cls, f, g):
-        """Tensor product of matrices."""
-        # input matrices
-        if f.data.is_sparse and g.data.is_sparse:
-            F, G = f.data, g.data
-        if f.data.is_sparse and not g.data.is_sparse:
-            F, G = f.data, g.data.to_sparse()
-        elif not f.data.is_sparse and g.data.is_sparse:
-            F, G = f.data.to_sparse(), g.data
-        else:
-            F, G = f.data, g.data
-        # sparse tensor product
-        if F.is_sparse and G.is_sparse:
-            # input sparse matrices
-            F, G = f.data.coalesce(), g.data.coalesce()
-            Ng, Mg = G.shape
-            Nf, Mf = F.shape
-            # tensor product on indices
-            ij, ab = F.indices(), G.indices()
-            Vf, Vg = F.values(), G.values()
-            IJ = ij.repeat_interleave(ab.shape[1], 1)
-            AB = ab.repeat(1, ij.shape[1])
-            XY = torch.tensor([Ng, Mg])[:, None] * IJ + AB
-            val = Vf.repeat_interleave(Vg.shape[0], 0) * Vg.repeat(Vf.shape[0])
-            # output sparse matrix
-            shape = [Nf * Ng, Mf * Mg]
-            data = torch.sparse_coo_tensor(XY, val, shape, device=F.device)
-            return data
-        # dense tensor product
-        raise Exception("Dense tensor product of operators not implemented")
+        """
+        Tensor product of matrices.
+
+        The product of sparse matrices is a sparse COO matrix, other
+        products are lazy Kronecker products, see :class:`lazy.Kron`.
+        """
+        sparse_layouts = ("coo", "csr", "csc")
+        if f.layout in sparse_layouts and g.layout in sparse_layouts:
+            return lazy.kron(f.asformat("coo"), g.asformat("coo"))
+        return lazy.Kron(f._spmv_(), g._spmv_())
 
 
 class Otimes(metaclass=NFunctor):
@@ -289,66 +352,29 @@ class Otimes(metaclass=NFunctor):
 
     start_dim = 0
 
-    def __new__(cls, Tens_A, Tens_B):
-        """Tensor product of linear spaces."""
+    @classmethod
+    def new(cls, Tens_A, Tens_B):
+        """Tensor product of linear spaces, with pure tensors `x | y`."""
         A, B = Tens_A.shape, Tens_B.shape
-
-        class Tens_AB(Tens([*A, *B])):
-
-            @classmethod
-            def pure(cls, x, y):
-                """Pure tensor."""
-                return cls(x | y)
-
-        Tens_AB.__name__ = cls.name(Tens_A, Tens_B)
-        Tens_AB.pure = Hom((Tens_A, Tens_B), Tens_AB)(Tens_AB.pure)
-        return Tens_AB
+        return Tens((*A, *B))
 
     def __init__(self, Tens_A, Tens_B):
         pass
 
     @classmethod
     def fmap(cls, f, g):
-        """Tensor product of matrices."""
-
-        # --- read input matrices ---
-        if f.data.is_sparse and g.data.is_sparse:
-            F, G = f.data, g.data
-        if f.data.is_sparse and not g.data.is_sparse:
-            F, G = f.data, g.data.to_sparse()
-        elif not f.data.is_sparse and g.data.is_sparse:
-            F, G = f.data.to_sparse(), g.data
-        else:
-            F, G = f.data, g.data
+        """
+        Tensor product of linear maps.
+
+        Dense factors are not multiplied: the product `F ⊗ G` is applied
+        to `x : Tens((*A, *B))` as `F X Gᵀ`, see :class:`lazy.Kron`, and
+        is only computed by :meth:`Linear.materialize`.
+        """
 
         # --- domain and codomain ---
         src = cls(f.src, g.src)
         tgt = cls(f.tgt, g.tgt)
-        Nf, Mf = F.shape
-        Ng, Mg = G.shape
-
-        # --- sparse tensor product ---
-        if F.is_sparse and G.is_sparse:
-            F, G = f.data.coalesce(), g.data.coalesce()
-            # tensor product on indices
-            ij, ab = F.indices(), G.indices()
-            Vf, Vg = F.values(), G.values()
-            IJ = ij.repeat_interleave(ab.shape[1], 1)
-            AB = ab.repeat(1, ij.shape[1])
-            XY = torch.tensor([Ng, Mg])[:, None] * IJ + AB
-            val = Vf.repeat_interleave(Vg.shape[0], 0) * Vg.repeat(Vf.shape[0])
-            # output sparse matrix
-            shape = [Nf * Ng, Mf * Mg]
-            data = torch.sparse_coo_tensor(XY, val, shape, device=F.device)
-
-        # --- dense tensor product ---
-        else:
-            FG = (
-                torch.outer(F.flatten(), G.flatten())
-                .reshape([Nf, Mf, Ng, Mg])
-                .transpose(1, 2)
-                .reshape([Nf * Ng, Mf * Mg])
-            )
-            data = FG
 
+        # --- sparse or lazy tensor product ---
+        data = Linear.otimes(f, g)
         return Linear(src, tgt)(data)
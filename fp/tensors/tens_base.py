@@ -1,7 +1,6 @@
-import torch
-
 from .tensor import Tensor, TensorBase
 from .shape import Torus
+from .interfaces import StatefulInterface
 from fp.base import Ring
 
 
@@ -12,20 +11,13 @@ class TensBase(Tensor, metaclass=Ring):
     domain: Torus
 
     def __init__(self, data):
-        super().__init__(data)
-        S = self.shape
         if isinstance(data, Tensor):
             data = data.data
-        if not isinstance(data, torch.Tensor):
-            data = torch.tensor(data)
-        if S == tuple(data.shape) or S == list(data.shape):
-            self.data = data
-        elif len(data.shape) == 0:
-            self.data = data
-        elif S[-len(data.shape) :] == list(data.shape):
-            self.data = data
-        else:
-            self.data = data.reshape(S)
+        super().__init__(data)
+        S, shape = tuple(self.shape), tuple(self.data.shape)
+        if not len(shape) or S[-len(shape) :] == shape:
+            return
+        self.data = self.data.reshape(S)
 
     def otimes(self, other):
         """
@@ -62,7 +54,8 @@ class TensBase(Tensor, metaclass=Ring):
 
     @classmethod
     def range(cls):
-        return cls(torch.arange(cls.domain.size).view(cls.shape))
+        xp = cls._interface_.module
+        return cls(xp.arange(cls.domain.size).reshape(cls.shape))
 
     @classmethod
     def embed(cls, *ds):
@@ -76,9 +69,18 @@ class TensBase(Tensor, metaclass=Ring):
 
         This is the pullback of the coordinate map `cls.domain.res(*ds)`,
         and the linear adjoint of `cls.proj(*ds)`.
+
+        Operators are cached on `(shape, ds)` for each backend, see
+        `Tens.operators`.
         """
+        api = str(StatefulInterface._initial_)
+        key = ("embed", api, tuple(cls.shape), tuple(int(d) for d in ds))
+        return cls._head_.operators(key, cls._embed_, *ds)
+
+    @classmethod
+    def _embed_(cls, *ds):
         res = cls.domain.res(*ds)
-        return Tens.cofmap(res)
+        return cls._head_.cofmap(res)
 
     @classmethod
     def proj(cls, *ds):
@@ -92,4 +94,6 @@ class TensBase(Tensor, metaclass=Ring):
         This is the pushforward of the coordinate map `cls.domain.res(*ds)`
         (acting on measures), and the adjoint of the algebra morphism `cls.embed(*ds)`.
         """
-        return cls.embed(*ds).t()
+        api = str(StatefulInterface._initial_)
+        key = ("proj", api, tuple(cls.shape), tuple(int(d) for d in ds))
+        return cls._head_.operators(key, lambda: cls.embed(*ds).t())
@@ -34,6 +34,9 @@ if HAS_JAX:
         def tree_unflatten(cls, aux_data, children):
             return cls(*children)
 
+else:
+    Jax = None
+
 
 if HAS_TORCH:
 
@@ -81,6 +84,9 @@ if HAS_TORCH:
         def __repr__(self):
             return str(self)
 
+else:
+    Torch = None
+
 
 stateful_interface = StatefulInterface.mock()
 
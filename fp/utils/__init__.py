@@ -1,7 +1,8 @@
 from .exceptions import *
 from .asserts import asserts
 from .log import log, warn, VERBOSITY, color
-from .cast import cast
+from .cast import cast, register_cast, cast_mode
+from .cache import TypeCache
 from .show import repr_method, str_method
 from .docs import document
 import fp.utils.inputs as inputs
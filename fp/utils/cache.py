@@ -1,4 +1,8 @@
-import functools 
+import functools
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
 
 def cache(f):
     """
@@ -11,3 +15,192 @@ def cache(f):
         except:
             return f(*xs, **ys)
     return cached
+
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize", "alive", "pinned"],
+)
+
+
+class TypeCache:
+    """
+    Bounded cache of type constructor calls.
+
+    The `maxsize` most recently used values are held in a LRU table.
+    Evicted values are only held by weak references, so that types
+    still in use are never constructed twice while unused types may be
+    garbage collected. Pinned values are never evicted.
+
+    Keys of evicted values refer to argument types by id, as values
+    usually refer back to their arguments: an entry is dropped when its
+    value or any of its argument types is collected.
+
+    Tables are guarded by a lock, released while values are computed.
+    If two threads compute the same value concurrently, the first one
+    stored is returned to both.
+
+    Example:
+    --------
+    .. code::
+
+        >>> List._cache_.cache_info()
+        CacheInfo(hits=3, misses=2, evictions=0, maxsize=256, currsize=2, alive=2, pinned=0)
+        >>> List.pin(Int)
+        List Int
+    """
+
+    maxsize: int = 256
+
+    _kwd_ = object()
+    _miss_ = object()
+    _id_ = object()
+
+    def __init__(self, f, maxsize=None):
+        self.f = f
+        self.maxsize = maxsize if maxsize is not None else self.maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._lru = OrderedDict()
+        # weak references to values, by weak key, see `_weak_key`
+        self._weak = {}
+        # weak references to argument types and their weak keys, by id
+        self._args = {}
+        self._pinned = {}
+        self._lock = threading.RLock()
+        functools.update_wrapper(self, f)
+
+    def key(self, *xs, **ys):
+        """Hashable key of a call."""
+        return xs if not ys else (*xs, self._kwd_, *ys.items())
+
+    def __call__(self, *xs, **ys):
+        key = self.key(*xs, **ys)
+        with self._lock:
+            value = self._lookup(key)
+        if value is not self._miss_:
+            return value
+        # --- new values, computed outside the lock
+        value = self.f(*xs, **ys)
+        with self._lock:
+            known = self._lookup(key)
+            if known is not self._miss_:
+                return known
+            self.misses += 1
+            try:
+                self._store(key, value)
+            except TypeError:
+                # not weakly referenceable: keep it forever
+                self._pinned[key] = value
+                return value
+            self._push(key, value)
+        return value
+
+    @classmethod
+    def _weak_key(cls, key):
+        """Key of the weak table, referring to argument types by id."""
+        if isinstance(key, tuple):
+            return tuple(cls._weak_key(x) for x in key)
+        if isinstance(key, type):
+            return (cls._id_, id(key))
+        return key
+
+    @classmethod
+    def _types(cls, key):
+        """Argument types of a key, see :meth:`_weak_key`."""
+        if isinstance(key, tuple):
+            for x in key:
+                yield from cls._types(x)
+        elif isinstance(key, type):
+            yield key
+
+    def _store(self, key, value):
+        """Hold a value by weak reference. The lock must be held."""
+        wkey = self._weak_key(key)
+        ref = weakref.ref(value, lambda ref: self._drop(wkey, ref))
+        self._weak[wkey] = ref
+        for T in self._types(key):
+            i = id(T)
+            if i not in self._args:
+                arg = weakref.ref(T, lambda _, i=i: self._drop_arg(i))
+                self._args[i] = (arg, set())
+            self._args[i][1].add(wkey)
+
+    def _drop(self, wkey, ref=None):
+        """Drop the weak entry of a collected value or argument."""
+        if ref is not None and self._weak.get(wkey) is not ref:
+            return
+        self._weak.pop(wkey, None)
+        for i in {i for _, i in self._ids(wkey)}:
+            entry = self._args.get(i)
+            if entry is not None:
+                entry[1].discard(wkey)
+                if not entry[1]:
+                    self._args.pop(i, None)
+
+    def _drop_arg(self, i):
+        """Drop the weak entries of a collected argument type."""
+        entry = self._args.pop(i, None)
+        for wkey in tuple(entry[1]) if entry is not None else ():
+            self._drop(wkey)
+
+    @classmethod
+    def _ids(cls, wkey):
+        """Argument type ids of a weak key, see :meth:`_weak_key`."""
+        if isinstance(wkey, tuple) and len(wkey) == 2 and wkey[0] is cls._id_:
+            yield wkey
+        elif isinstance(wkey, tuple):
+            for x in wkey:
+                yield from cls._ids(x)
+
+    def _lookup(self, key):
+        """Cached value of a key, or `_miss_`. The lock must be held."""
+        # --- hot values
+        if key in self._lru:
+            self.hits += 1
+            self._lru.move_to_end(key)
+            return self._lru[key]
+        if key in self._pinned:
+            self.hits += 1
+            return self._pinned[key]
+        # --- values still alive
+        ref = self._weak.get(self._weak_key(key))
+        value = ref() if ref is not None else None
+        if value is None:
+            return self._miss_
+        self.hits += 1
+        self._push(key, value)
+        return value
+
+    def _push(self, key, value):
+        self._lru[key] = value
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    def pin(self, *xs, **ys):
+        """Compute and hold a value until :meth:`unpin` is called."""
+        key = self.key(*xs, **ys)
+        value = self(*xs, **ys)
+        with self._lock:
+            self._pinned[key] = value
+        return value
+
+    def unpin(self, *xs, **ys):
+        """Release a pinned value to the LRU table."""
+        key = self.key(*xs, **ys)
+        with self._lock:
+            value = self._pinned.pop(key, None)
+            if value is not None and key not in self._lru:
+                self._push(key, value)
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics, as `functools.lru_cache` does."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._lru),
+            len(self._weak),
+            len(self._pinned),
+        )
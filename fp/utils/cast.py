@@ -1,24 +1,159 @@
-from typing import Any
+import contextvars
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Literal
+
 from .exceptions import CastError
 
+# cast mode of the current context, see `cast_mode`
+_mode = contextvars.ContextVar("cast_mode", default="safe")
+
+# explicit converters, keyed by (source type, target type)
+_converters: dict[tuple[type, type], Callable] = {}
+
+# resolved conversions to targets without a `_casts_` attribute, keyed by A
+_resolved: dict[type, dict[type, Callable]] = {}
+_max_resolved = 4096
+
+# targets holding their resolved conversions, see `_casts_of`
+_targets = weakref.WeakSet()
+
 
 def cast(x: Any, A: type):
+    """
+    Cast a value `x` to the type `A`.
+
+    In the default "safe" mode, `x` is returned if it is an instance of `A`,
+    otherwise it is converted by:
+
+    * a converter registered for `(type(x), A)`, see :func:`register_cast`,
+    * the `A.cast` method if defined,
+    * the `A(x)` constructor, raising a `CastError` on failure.
+
+    The resolved conversion is cached on `A` by `type(x)`, see
+    :func:`_casts_of`. See :func:`cast_mode` for the "strict" and
+    "confident" modes.
+    """
+    mode = _mode.get()
+    if mode != "safe":
+        return _cast_modes[mode](x, A)
+    try:
+        casts = A.__dict__["_casts_"]
+    except (AttributeError, KeyError):
+        casts = _casts_of(A)
+        if casts is None:
+            # unhashable target
+            return _resolve(x, A)(x)
+    f = casts.get(type(x))
+    if f is None:
+        f = casts[type(x)] = _resolve(x, A)
+    return f(x)
+
+
+def _casts_of(A) -> dict[type, Callable] | None:
+    """
+    Resolved conversions to `A`, keyed by source type.
+
+    They are stored as the `_casts_` attribute of `A`, so that they are
+    collected with dynamic types. Targets which do not accept attributes
+    (e.g. builtin types) use a bounded global table instead, and `None`
+    is returned on unhashable targets.
+    """
+    if isinstance(A, type):
+        try:
+            A._casts_ = {}
+            _targets.add(A)
+            return A._casts_
+        except (AttributeError, TypeError):
+            pass
+    try:
+        casts = _resolved.get(A)
+    except TypeError:
+        return None
+    if casts is None:
+        if len(_resolved) >= _max_resolved:
+            _resolved.clear()
+        casts = _resolved[A] = {}
+    return casts
+
+
+def _identity(x):
+    return x
+
 
-    # safe mode
+def _has_cast(A) -> bool:
+    if isinstance(A, type):
+        return any("cast" in vars(B) for B in A.__mro__)
+    return "cast" in dir(A)
+
+
+def _resolve(x: Any, A: type) -> Callable:
+    """Conversion function of values of type `type(x)` to `A`."""
     if isinstance(x, A):
-        return x
-    elif "cast" in dir(A):
-        return A.cast(x)
-    else:
+        return _identity
+    for B in type(x).__mro__:
+        if (B, A) in _converters:
+            return _converters[B, A]
+    if _has_cast(A):
+        return A.cast
+
+    def construct(x):
         try:
             return A(x)
         except Exception as e:
             raise CastError(A, x)
 
-    # strict mode
+    return construct
+
+
+def _cast_strict(x: Any, A: type):
     if not isinstance(x, A):
         raise TypeError(f"> Casting {type(x)} value to type {A}")
     return x
 
-    # confident mode
+
+def _cast_confident(x: Any, A: type):
     return x
+
+
+_cast_modes = {"strict": _cast_strict, "confident": _cast_confident}
+
+
+def register_cast(src: type, A: type, f: Callable | None = None):
+    """
+    Register a converter `f` of `src` values to `A`.
+
+    Registered converters take precedence over `A.cast` and `A(x)`, and also
+    apply to values of subclasses of `src`. May be used as a decorator::
+
+        >>> @register_cast(str, Int)
+        ... def parse_int(s):
+        ...     return Int(s.strip())
+    """
+    if f is None:
+        return lambda f: register_cast(src, A, f)
+    _converters[src, A] = f
+    _resolved.clear()
+    for T in list(_targets):
+        T._casts_.clear()
+    return f
+
+
+@contextmanager
+def cast_mode(mode: Literal["safe", "strict", "confident"]):
+    """
+    Select the cast mode within a block.
+
+    * "safe": convert values to the target type (default),
+    * "strict": raise a `TypeError` on values not of the target type,
+    * "confident": return values unchecked.
+
+    The mode is local to the current thread or asyncio task.
+    """
+    if mode != "safe" and mode not in _cast_modes:
+        raise ValueError(f"Unknown cast mode {mode}")
+    token = _mode.set(mode)
+    try:
+        yield mode
+    finally:
+        _mode.reset(token)
@@ -1,6 +1,8 @@
 import asyncio
+import gc
+import operator
 import pytest
-from time import time
+from time import time, sleep
 
 import fp
 from fp.meta import Type
@@ -14,6 +16,16 @@ async def answer():
     return Int(42)
 
 
+@Hom(Int, Int)
+def inc(n):
+    return n + 1
+
+
+@Hom((Int, Int), Int)
+def add(x, y):
+    return x + y
+
+
 SLEEP_SECONDS = 1
 
 
@@ -67,3 +79,118 @@ class TestAsyncIO:
     def test_gets(self, monkeypatch):
         monkeypatch.setattr(fp.utils.inputs, "_input", lambda: "hello world!")
         assert IO.gets(Str.len).run() == 12
+
+    def test_gather_bounded(self):
+        running = [0, 0]
+
+        def io(n):
+            async def run():
+                running[0] += 1
+                running[1] = max(running)
+                await asyncio.sleep(0.001 * (n % 3))
+                running[0] -= 1
+                return Int(n)
+
+            return IO(Int)(run)
+
+        gather = IO.gather_bounded([io(n) for n in range(12)], max_concurrency=3)
+        assert gather.run() == list(range(12))
+        assert running[1] == 3
+
+    def test_gather_bounded_timeout(self):
+        ios = [IO.sleep(1), self.io]
+        assert IO.gather_bounded(ios, 2, timeout=0.01).run() == [None, 42]
+
+    def test_gather_bounded_cancel(self):
+        cancelled = []
+
+        @IO(Int)
+        async def fail():
+            raise RuntimeError("failed")
+
+        @IO(Int)
+        async def wait():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(RuntimeError):
+            IO.gather_bounded([wait, fail], 2).run()
+        assert cancelled == [True]
+
+    def test_gather_bounded_errors(self, caplog):
+
+        def fail(n):
+            async def run():
+                raise RuntimeError(f"failed {n}")
+
+            return IO(Int)(run)
+
+        with pytest.raises(RuntimeError):
+            IO.gather_bounded([fail(0), fail(1)], 2).run()
+        gc.collect()
+        assert "never retrieved" not in caplog.text
+
+    def test_map_concurrent(self):
+
+        @Hom(Int, IO(Int))
+        def delay(n):
+            async def run():
+                await asyncio.sleep(0.001 * n)
+                return n
+
+            return IO(Int)(run)
+
+        ns = [3, 1, 2]
+        assert IO.map_concurrent(delay, ns, limit=3).run() == [3, 1, 2]
+        assert IO.map_concurrent(delay, ns, 3, ordered=False).run() == [1, 2, 3]
+
+    def test_runtime(self):
+
+        @IO(Int)
+        async def loop_id():
+            return id(asyncio.get_running_loop())
+
+        with IO.runtime():
+            assert loop_id.run() == loop_id.run()
+            assert self.io.run() == 42
+
+    def test_run_many(self):
+        ios = [self.io, IO.unit(Int(3))]
+        assert IO.run_many(ios) == [42, 3]
+        assert IO.run_many(ios, max_concurrency=1) == [42, 3]
+
+    def test_lift_blocking(self):
+
+        @Hom(Int, Int)
+        def slow(n):
+            sleep(0.05)
+            return n + 1
+
+        lifted = IO.lift_blocking(slow, "thread", max_workers=2)
+        assert isinstance(lifted(1), IO(Int))
+        t0 = time()
+        assert IO.run_many([lifted(1), lifted(2)]) == [2, 3]
+        assert time() - t0 < 0.09
+        IO.shutdown()
+
+    def test_lift_blocking_process(self):
+        total = Hom(fp.List(Int), Int)(sum)
+        lifted = IO.lift_blocking(total, "process", max_workers=1)
+        assert lifted(fp.List(Int)([1, 2, 3])).run() == 6
+        IO.shutdown()
+
+    def test_lift_blocking_process_arrows(self):
+        lifted = IO.lift_blocking(inc, "process", max_workers=1)
+        assert lifted(1).run() == 2
+        lifted = IO.lift_blocking(add, "process", max_workers=1)
+        assert lifted(1, 2).run() == 3
+        IO.shutdown()
+
+    def test_lift_blocking_process_nary(self):
+        mul = Hom((Int, Int), Int)(operator.mul)
+        lifted = IO.lift_blocking(mul, "process", max_workers=1)
+        assert lifted(3, 4).run() == 12
+        IO.shutdown()
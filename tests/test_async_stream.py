@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+
+import fp
+from fp.cartesian import Hom
+from fp.base import Int, List
+from fp.instances import AsyncIO, AsyncStream
+
+
+@AsyncStream(Int)
+async def naturals():
+    n = 0
+    while True:
+        yield Int(n)
+        n += 1
+
+
+class TestAsyncStream:
+
+    def test_new(self):
+        assert isinstance(AsyncStream(Int), fp.Type)
+        assert isinstance(naturals, AsyncStream(Int))
+
+    def test_take(self):
+        assert naturals.take(3).run() == [0, 1, 2]
+
+    def test_filter(self):
+        odd = naturals.filter(lambda n: n % 2)
+        assert odd.take(3).run() == [1, 3, 5]
+
+    def test_map(self):
+        square = Hom(Int, Int)(lambda n: n * n)
+        assert naturals.map(square).take(4).run() == [0, 1, 4, 9]
+
+    def test_bind(self):
+
+        @Hom(Int, AsyncStream(Int))
+        def repeat(n):
+            return AsyncStream.from_iterable([n] * n, Int)
+
+        assert naturals.take(4).bind(repeat).run() == [1, 2, 2, 3, 3, 3]
+
+    def test_batch(self):
+        batches = naturals.take(5).batch(2)
+        assert batches.run() == [[0, 1], [2, 3], [4]]
+        assert batches._type_ is List(Int)
+
+    def test_window(self):
+        assert naturals.take(4).window(2).run() == [[0, 1], [1, 2], [2, 3]]
+        assert naturals.take(5).window(3, 2).run() == [[0, 1, 2], [2, 3, 4]]
+
+    def test_invalid_sizes(self):
+        assert naturals.take(0).run() == []
+        with pytest.raises(ValueError):
+            naturals.take(-1)
+        with pytest.raises(ValueError):
+            naturals.batch(0)
+        with pytest.raises(ValueError):
+            naturals.window(0)
+        with pytest.raises(ValueError):
+            naturals.window(2, 0)
+        with pytest.raises(ValueError):
+            naturals.buffer(0)
+
+    def test_buffer(self):
+        produced = []
+
+        @AsyncStream(Int)
+        async def count():
+            n = 0
+            while True:
+                produced.append(n)
+                yield Int(n)
+                n += 1
+
+        async def main():
+            xs = await count.buffer(2).take(3).collect()
+            await asyncio.sleep(0.01)
+            return xs
+
+        assert asyncio.run(main()) == [0, 1, 2]
+        assert len(produced) <= 6
+
+    def test_collect(self):
+        collect = naturals.take(2).collect()
+        assert isinstance(collect, AsyncIO(List(Int)))
+        assert AsyncIO.wait([collect, AsyncIO.unit(Int(0))]).run() == [[0, 1], 0]
+
+    def test_as_completed(self):
+        ios = [AsyncIO.unit(Int(n)) for n in range(4)]
+        assert sorted(AsyncStream.as_completed(ios, 2).run()) == [0, 1, 2, 3]
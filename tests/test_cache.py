@@ -0,0 +1,68 @@
+import gc
+import weakref
+
+from fp.meta import Type
+from fp.cartesian import Prod
+from fp.base import List, Int, Str
+from fp.utils import TypeCache
+
+
+def test_identity():
+    assert List(Int) is List(Int)
+    assert Prod(Int, Str) is Prod(Int, Str)
+
+
+def test_lru_bound():
+    cache = TypeCache(lambda n: Type(f"T{n}", (), {}), maxsize=4)
+    Ts = [cache(n) for n in range(10)]
+    info = cache.cache_info()
+    assert info.currsize == 4 and info.evictions == 6
+    # evicted types still in use are not constructed twice
+    assert cache(0) is Ts[0]
+
+
+def test_weak_eviction():
+    cache = TypeCache(lambda n: Type(f"T{n}", (), {}), maxsize=1)
+    for n in range(10):
+        cache(n)
+    gc.collect()
+    assert cache.cache_info().alive <= 1
+
+
+def test_pin():
+    cache = TypeCache(lambda n: Type(f"T{n}", (), {}), maxsize=1)
+    T0 = cache.pin(0)
+    for n in range(1, 10):
+        cache(n)
+    assert cache(0) is T0
+    assert cache.cache_info().pinned == 1
+
+
+def test_constructor_pin():
+    assert List.pin(Str) is List(Str)
+    assert List._cache_.cache_info().pinned >= 1
+    List.unpin(Str)
+
+
+def test_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = TypeCache(lambda n: Type(f"T{n}", (), {}), maxsize=8)
+    with ThreadPoolExecutor(8) as pool:
+        Ts = list(pool.map(lambda i: cache(i % 32), range(4000)))
+    assert all(T is cache(i % 32) for i, T in enumerate(Ts))
+    assert cache.cache_info().currsize == 8
+
+
+def test_dynamic_types_collected():
+    from fp.tensors import Tens, Linear
+
+    def build(ns):
+        return [weakref.ref(Linear(Tens((n,)), Tens((n,)))) for n in ns]
+
+    n0 = 1 << 20
+    refs = build(range(n0, n0 + 300))
+    build(range(n0 + 300, n0 + 600))
+    gc.collect()
+    assert not any(ref() is not None for ref in refs)
+    assert Linear._cache_.cache_info().alive <= 2 * Linear._cache_.maxsize
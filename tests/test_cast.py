@@ -0,0 +1,53 @@
+import gc
+import weakref
+
+import pytest
+
+import fp.utils as utils
+from fp.base import Int, Str
+
+
+class Celsius(float): ...
+
+
+def test_cast():
+    x = Int(3)
+    assert utils.cast(x, Int) is x
+    assert type(utils.cast("3", Int)) is Int
+    with pytest.raises(utils.CastError):
+        utils.cast("three", Int)
+
+
+def test_register_cast():
+    utils.register_cast(str, Celsius, lambda s: Celsius(s.rstrip("C")))
+    assert utils.cast("21.5C", Celsius) == 21.5
+    assert utils.cast(12, Celsius) == 12.0
+
+
+def test_register_resolved():
+    class Kelvin(float): ...
+
+    assert utils.cast(1, Kelvin) == 1.0
+    utils.register_cast(int, Kelvin, lambda n: Kelvin(n + 273.15))
+    assert utils.cast(1, Kelvin) == 274.15
+
+
+def test_cast_collected():
+    refs = []
+    for n in range(100):
+        T = type(f"T{n}", (int,), {})
+        assert type(utils.cast(n, T)) is T
+        refs.append(weakref.ref(T))
+    del T
+    gc.collect()
+    assert not any(ref() is not None for ref in refs)
+
+
+def test_cast_mode():
+    with utils.cast_mode("strict"):
+        with pytest.raises(TypeError):
+            utils.cast(3, Int)
+        assert utils.cast(Int(3), Int) == 3
+    with utils.cast_mode("confident"):
+        assert type(utils.cast(3, Int)) is int
+    assert type(utils.cast(3, Int)) is Int
@@ -2,6 +2,7 @@ import pytest
 
 from fp.meta import Type
 from fp.cartesian import Hom
+from fp.base import List
 
 # we need at least 2 types
 A = Type("A", (int,), {})
@@ -183,3 +184,53 @@ class TestHom:
         f = Hom((int, int), (int, int))(divmod)
         assert f.tgt is Type.Prod(int, int)
         assert f(7, 2) == (3, 1)
+
+    def test_call_specialized(self):
+        add = Hom((A, A), A)(lambda x, y: x + y)
+        assert add(1, 2) == A(3) and isinstance(add(1, 2), A)
+        assert add(A(1), A(2)) == A(3)
+        assert add(add.src(1, 2)) == A(3)
+        assert len(add._calls_) == 3
+
+    def test_call_specialized_var(self):
+        pair = Hom("X", Type.Prod("X", "X"))(lambda x: (x, x))
+        assert pair(A(1)) == (1, 1)
+        assert pair(B("a")) == ("a", "a")
+        assert len(pair._calls_) == 2
+
+    def test_fuse(self):
+        foobar = Hom.fuse(self.bar, self.foo)
+        assert len(foobar._pipe) == 1
+        assert (foobar.src, foobar.tgt) == (A, A)
+        assert foobar(A(32)) == (self.foo @ self.bar)(A(32))
+
+    def test_fuse_cast(self):
+        half = Hom(int, float)(lambda x: x / 2)
+        bar = Hom(int, str)(lambda x: "|" * x)
+        assert Hom.fuse(half, bar, elide=True)(5) == "||"
+        with pytest.raises(TypeError):
+            Hom.compose(half, bar)(5)
+        with pytest.raises(TypeError):
+            half.fuse(Hom(float, str)(lambda x: "|" * x))(5)
+
+    def test_fuse_polymorphic(self):
+        inc = Hom(int, int)(lambda x: x + 1)
+        wrap = Hom("A", List("A"))(lambda x: [x])
+        assert Hom.fuse(inc, wrap)(1) == Hom.compose(inc, wrap)(1) == [2]
+        assert Hom.fuse(inc, wrap, elide=False)(1) == [2]
+
+    def test_map_batch(self):
+        ys = self.bar.map_batch([1, 2])
+        assert ys == [B("|"), B("||")]
+        assert all(isinstance(y, B) for y in ys)
+
+    def test_map_batch_kernel(self):
+        np = pytest.importorskip("numpy")
+        square = Hom(float, float)(lambda x: x * x)
+
+        @square.vectorize
+        def square(xs):
+            return xs**2
+
+        assert square(3.0) == 9.0
+        assert tuple(square.map_batch(np.arange(3.0))) == (0.0, 1.0, 4.0)
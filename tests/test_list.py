@@ -0,0 +1,69 @@
+import json
+import pytest
+from array import array
+
+from fp.cartesian import Hom
+from fp.base import Int, Float, Bool, Str, List
+
+
+def test_list_protocol():
+    xs = List(Int)([1, 2])
+    assert isinstance(xs, list)
+    assert json.dumps(xs) == "[1, 2]"
+    assert [0] + xs == [0, 1, 2] and 2 * xs == [1, 2, 1, 2]
+    assert xs < List(Int)([1, 3])
+
+
+class TestPacked:
+
+    def test_storage(self):
+        xs = List.packed(Int)(range(4))
+        assert isinstance(xs, List.Packed)
+        assert isinstance(xs.data, array) and xs.data.typecode == "q"
+        assert not isinstance(List(Int)(range(4)), List.Packed)
+        with pytest.raises(TypeError):
+            List.packed(Str)
+
+    def test_boxed(self):
+        xs = List.packed(Float)([1, "2.5"])
+        assert xs == [1.0, 2.5]
+        assert type(xs[0]) is Float
+        assert all(type(b) is Bool for b in List.packed(Bool)([3, 0]))
+
+    def test_slice(self):
+        xs = List.packed(Int)(range(5))
+        assert xs[1:3] == [1, 2] and type(xs[1:3]) is List.packed(Int)
+
+    def test_mutate(self):
+        xs = List.packed(Int)([3, 1])
+        xs.append(2)
+        xs.sort()
+        xs[0] = 7
+        assert xs == [7, 2, 3]
+        assert xs + List.packed(Int)([0]) == [7, 2, 3, 0]
+
+    def test_overflow(self):
+        xs = List.packed(Int)([1])
+        xs.append(2**70)
+        assert xs == [1, 2**70]
+        assert type(xs[1]) is Int
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        xs = List.packed(Float)(np.arange(3.0))
+        assert xs == [0.0, 1.0, 2.0]
+        assert np.asarray(xs).dtype == np.float64
+
+    def test_kernel(self):
+        pytest.importorskip("numpy")
+        calls = []
+        square = Hom(Int, Int)(lambda n: n * n)
+
+        @square.vectorize
+        def square(ns):
+            calls.append(ns)
+            return ns * ns
+
+        ys = square.map_batch(List.packed(Int)(range(4)))
+        assert ys == [0, 1, 4, 9] and type(ys) is List.packed(Int)
+        assert len(calls) == 1
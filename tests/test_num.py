@@ -0,0 +1,22 @@
+from fp.base import Int, Float, Bool
+
+
+def test_int_ops():
+    a, b = Int(3), Int(4)
+    for y, z in [(a + b, 7), (a * b, 12), (a - b, -1), (-a, -3)]:
+        assert type(y) is Int and y == z
+    assert type(Int.add(a, b)) is Int
+
+
+def test_float_ops():
+    x = Float(1.5) * Int(2)
+    assert type(x) is Float and x == 3.0
+    assert type(Float(3) / Float(2)) is Float
+
+
+def test_bool_ops():
+    t, f = Bool(1), Bool(0)
+    assert (t + t) is Bool.cast(1)
+    assert (t * f) is Bool.cast(0)
+    assert -t is Bool.cast(0)
+    assert type(Int.eq(Int(1), Int(1))) is Bool
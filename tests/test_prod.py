@@ -27,3 +27,27 @@ def test_fmap():
     pair = foo_bar.src(4, "couscous")
     assert foo_bar(pair) == (16, "vilain couscous")
     assert foo_bar(3, "cuzco") == (8, "vilain cuzco")
+
+
+def test_init_typed():
+    int_str = Prod(fp.Int, fp.Str)
+    a, b = fp.Int(3), fp.Str("abc")
+    pair = int_str(a, b)
+    assert pair[0] is a and pair[1] is b
+    assert type(int_str(3, "abc")[0]) is fp.Int
+
+
+def test_init_arity():
+    try:
+        Prod(int, str)(3)
+        assert False
+    except TypeError:
+        pass
+
+
+def test_branch():
+    foo = Hom(int, int)(lambda x: 2**x)
+    bar = Hom(int, str)(lambda x: x * "|")
+    foo_bar = Prod.branch(foo, bar)
+    assert foo_bar(3) == (8, "|||")
+    assert type(foo_bar(3)) is Prod(int, str)
@@ -48,3 +48,43 @@ class TestState:
         binlength = self.length.bind(binary)
         # 11 = 8 + . + 2 + 1
         assert binlength.exec("hello world") == "|.||"
+
+    def test_bind_deep(self):
+        St = State(Int)
+        step = fp.Hom(Int, St(Int))(lambda a: St(Int)(lambda s: (s + 1, a + s)))
+        st = St.unit(Int(0))
+        for _ in range(5000):
+            st = st.bind(step)
+        assert st.run(0) == (5000, 5000 * 4999 // 2)
+
+    def test_bind_recursive(self):
+        St = State(Int)
+
+        @fp.Hom(Int, St(Int))
+        def countdown(n):
+            tick = St(Int)(lambda s: (s + 1, n - 1))
+            return tick.bind(countdown) if n > 0 else tick
+
+        assert countdown(5000).exec(0) == 5001
+
+    def test_put_gets(self):
+        St = State(Int)
+        st = St.put(Int(3)).puts(lambda s: s + 1).gets(fp.Hom(Int, Str)(str))
+        assert st.run(0) == (4, "4")
+
+    def test_run_many(self):
+        runs = self.length.run_many(["", "abc"])
+        assert runs == [("", 0), ("", 3)]
+        assert type(runs) is fp.List(self.length.tgt)
+
+    def test_run_batch(self):
+        ss, ns = self.length.run_batch(["", "abc"])
+        assert ss == ["", ""] and ns == [0, 3]
+        assert type(ns) is fp.List(Int)
+
+    def test_run_many_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(2) as ex:
+            runs = self.length.run_many(["a", "bc", "def"], executor=ex)
+        assert [n for s, n in runs] == [1, 2, 3]
@@ -43,3 +43,7 @@ class TestStateful:
         mock = self.M.get.mock()
         with self.M.use(""):
             assert mock.__len__() == 0
+
+    def test_run_many(self):
+        length = self.M.get.map(Str.len)
+        assert length.run_many(["", "ab"]) == [("", 0), ("ab", 2)]
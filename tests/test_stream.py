@@ -0,0 +1,65 @@
+import pytest
+
+from fp.cartesian import Hom
+from fp.base import Int, List, Stream
+
+
+@Stream(Int)
+def naturals():
+    n = 0
+    while True:
+        yield Int(n)
+        n += 1
+
+
+class TestStream:
+
+    square = Hom(Int, Int)(lambda n: n * n)
+
+    def test_lazy(self):
+        seen = []
+
+        def count():
+            for n in range(10):
+                seen.append(n)
+                yield Int(n)
+
+        xs = Stream(Int)(count).map(self.square)
+        assert seen == []
+        assert xs.take(2).collect() == [0, 1]
+        assert seen == [0, 1]
+
+    def test_collect(self):
+        xs = naturals.take(3).collect()
+        assert xs == [0, 1, 2] and type(xs) is List(Int)
+
+    def test_reiterable(self):
+        xs = Stream(Int)(range(3))
+        assert list(xs) == list(xs) == [0, 1, 2]
+
+    def test_one_shot(self):
+        with pytest.raises(TypeError):
+            Stream(Int)(Int(n) for n in range(3))
+        with pytest.raises(TypeError):
+            Stream(Int)(iter([1, 2]))
+
+    def test_fmap(self):
+        assert Stream.fmap(self.square)(naturals).take(3).collect() == [0, 1, 4]
+
+    def test_filter(self):
+        assert naturals.filter(lambda n: n % 3 == 0).take(3).collect() == [0, 3, 6]
+
+    def test_bind(self):
+        repeat = Hom(Int, Stream(Int))(lambda n: Stream(Int)([n] * n))
+        assert naturals.take(4).bind(repeat).collect() == [1, 2, 2, 3, 3, 3]
+
+    def test_join(self):
+        xx = Stream(Stream(Int))([naturals.take(2), naturals.take(1)])
+        assert Stream.join(xx).collect() == [0, 1, 0]
+
+
+def test_list_join():
+    xx = List(List(Int))([[1, 2], [], [3]] * 1000)
+    xs = List.join(xx)
+    assert type(xs) is List(Int)
+    assert len(xs) == 3000 and xs[:3] == [1, 2, 3]
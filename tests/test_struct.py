@@ -0,0 +1,152 @@
+import pytest
+
+import fp.utils as utils
+
+from fp.cartesian import Hom
+from fp.base import Int, Str, List, struct
+
+
+@struct
+class Person:
+    name: Str
+    age: Int = 0
+    tags: List(Str) = []
+
+
+class TestStruct:
+
+    def test_init(self):
+        jack = Person("Jack", age=31)
+        assert isinstance(jack.name, Str) and isinstance(jack.age, Int)
+        assert (jack.name, jack.age) == ("Jack", 31)
+        assert Person("Lucy").age == 0
+
+    def test_init_missing(self):
+        with pytest.raises(utils.KeyError):
+            Person(age=3)
+
+    def test_make_unchecked(self):
+        jack = Person.make_unchecked(Str("Jack"))
+        assert isinstance(jack, Person)
+        assert jack.name == "Jack" and isinstance(jack.age, Int)
+
+    def test_replace(self):
+        jack = Person("Jack", tags=["a"])
+        older = jack.replace(age=32)
+        assert type(older) is Person
+        assert (older.age, jack.age) == (32, 0)
+        assert older.tags is jack.tags
+
+    def test_copy(self):
+        jack = Person("Jack")
+        assert jack.copy() is not jack
+        assert jack.copy().name is jack.name
+
+    def test_field_set(self):
+        jack = Person("Jack")
+        older = Person.age.set(32, jack)
+        assert (older.age, jack.age) == (32, 0)
+        assert Person.age.set(40)(jack).age == 40
+
+    def test_field_put(self):
+        jack = Person("Jack")
+        assert Person.age.put(32, jack) is jack
+        assert jack.age == 32
+
+    def test_map(self):
+        older = Hom(Int, Int)(lambda n: n + 1)
+        jack = Person("Jack", 31)
+        mapped = jack.map(age=older, name=(len, Int))
+        assert (mapped.name, mapped.age) == (4, 32)
+        assert mapped.keys() == ("name", "age")
+        assert type(mapped) is type(jack.map(age=older, name=(len, Int)))
+
+    def test_map_batch(self):
+        older = Hom(Int, Int)(lambda n: n + 1)
+        people = [Person("Jack", 31), Person("Lucy", 27)]
+        mapped = Person.map_batch(people, age=older)
+        assert [p.age for p in mapped] == [32, 28]
+        assert type(mapped[0]) is type(mapped[1])
+
+    def test_map_batch_empty(self):
+        older = Hom(Int, Int)(lambda n: n + 1)
+        mapped = Person.map_batch([], age=older, name=(len, Int))
+        (T,) = type(mapped)._tail_
+        assert len(mapped) == 0 and T._keys_ == ("name", "age")
+        assert T is type(Person("Jack").map(age=older, name=(len, Int)))
+        with pytest.raises(ValueError):
+            Person.map_batch([], name=len)
+
+    def test_map_types_bounded(self):
+        T = Int
+        for n in range(3 * Person._max_maps_):
+            T = List(T)
+            Person._map_type_((("age", T),))
+        assert Person._maps_.cache_info().currsize <= Person._max_maps_
+
+
+class TestStructBatch:
+
+    batch = Person.Batch(["Jack", "Lucy"], age=[31, 27])
+
+    def test_columns(self):
+        assert isinstance(self.batch.name, List(Str))
+        assert self.batch.age == [31, 27]
+        assert len(self.batch) == 2
+
+    def test_default(self):
+        batch = Person.Batch(["Jack", "Lucy"])
+        assert batch.age == [0, 0]
+
+    def test_default_skipped(self):
+        batch = Person.Batch(["Jack"], tags=[["a"]])
+        jack = batch[0]
+        assert (jack.name, jack.age, jack.tags) == ("Jack", 0, ["a"])
+        assert [p.tags for p in batch] == [["a"]]
+
+    def test_rows(self):
+        lucy = self.batch[1]
+        assert isinstance(lucy, Person)
+        assert (lucy.name, lucy.age) == ("Lucy", 27)
+        assert Person.Batch.from_rows(self.batch.rows()).name == self.batch.name
+
+    def test_map(self):
+        older = Hom(Int, Int)(lambda n: n + 1)
+        mapped = self.batch.map(age=older, name=Str.len)
+        assert mapped.age == [32, 28]
+        assert mapped.name == [4, 4]
+
+    def test_map_array(self):
+        np = pytest.importorskip("numpy")
+        batch = Person.Batch(["Jack", "Lucy"], age=np.array([31, 27]))
+        mapped = batch.map(age=lambda ages: ages + 1)
+        assert tuple(mapped.age) == (32, 28)
+
+    def test_pull(self):
+        names = self.batch.pull(("name",))
+        assert names.keys() == ("name",)
+        assert names.name == self.batch.name
+
+
+class TestStructInheritance:
+
+    @struct
+    class P:
+        x: Int
+        y: Int = 0
+
+        def copy(self):
+            return self.replace(y=-1)
+
+    class Q(P):
+        z: Int = 0
+
+    def test_inherited_method(self):
+        assert self.Q(1, 2).copy().y == -1
+        assert self.Q(1, 2, 3).copy().z == 3
+
+    def test_generated_methods(self):
+        q = self.Q(1, z=3)
+        assert (q.x, q.y, q.z) == (1, 0, 3)
+        assert self.Q.replace is not self.P.replace
+        assert q.replace(y=2).z == 3
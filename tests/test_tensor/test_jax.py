@@ -1,5 +1,7 @@
 import pytest
 
+pytest.importorskip("jax")
+
 from _test_tensor import _TestTensor
 from fp.tensors import Jax
 
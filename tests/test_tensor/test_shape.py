@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+
+from fp.tensors import Torus, Tensor
+from fp.tensors.interfaces import HAS_TORCH, HAS_JAX
+
+
+class TestTorus:
+
+    S = Torus((2, 3))
+
+    def test_new(self):
+        assert Torus([2, 3]) is self.S
+        assert self.S.size == 6
+        assert self.S.mod == (3, 1)
+
+    def test_coords(self):
+        ijs = self.S.coords(np.arange(6)).data
+        assert ijs.tolist() == [[0, 0], [0, 1], [0, 2], [1, 0], [1, 1], [1, 2]]
+        assert self.S.coords(4).data.tolist() == [1, 1]
+
+    def test_index(self):
+        js = np.array([[1, 2], [0, 1]])
+        assert self.S.index(js).data.tolist() == [5, 1]
+
+    def test_batch(self):
+        S = Torus((4, 5, 6))
+        i = np.arange(120).reshape(10, 12)
+        ijk = S.coords(i)
+        assert ijk.data.shape == (10, 12, 3)
+        assert (S.index(ijk).data == i).all()
+
+    def test_int32(self):
+        ijs = self.S.coords(np.arange(6, dtype=np.int32))
+        assert ijs.data.dtype == np.int32
+        assert self.S.index(ijs).data.dtype == np.int32
+
+    def test_res_embed(self):
+        js = np.array([[1, 2], [0, 1]])
+        assert self.S.res(1)(js).data.tolist() == [[2], [1]]
+        assert self.S.embed(1)(np.array([[2], [1]])).data.tolist() == [[0, 2], [0, 1]]
+
+    @pytest.mark.parametrize(
+        "backend",
+        ["numpy"] + ["torch"] * HAS_TORCH + ["jax"] * HAS_JAX,
+    )
+    def test_backend(self, backend):
+        with Tensor.use(backend) as api:
+            i = api.asarray(np.arange(6, dtype=np.int32))
+            ijs = self.S.coords(i)
+            assert isinstance(ijs.data, api.Array)
+            assert np.asarray(self.S.index(ijs).data).tolist() == list(range(6))
@@ -1,5 +1,22 @@
 import pytest
-from fp.tensors import Tens
+import numpy as np
+
+from fp.cartesian.hom import _typing_hooks
+from fp.tensors import Tens, Linear, Otimes, Tensor
+from fp.tensors import lazy, sparse
+from fp.tensors.interfaces import INTERFACES, HAS_TORCH, HAS_JAX
+from fp.tensors.operator_cache import OperatorCache
+
+BACKENDS = ["numpy"] + ["torch"] * HAS_TORCH + ["jax"] * HAS_JAX
+
+
+def api(backend):
+    return INTERFACES[backend]
+
+
+def dense(f):
+    """Dense numpy matrix of a Linear map."""
+    return np.asarray(sparse.convert(f.data, "dense"))
 
 
 class TestTens:
@@ -38,3 +55,162 @@ class TestTens:
         expect = (1, -1, -1, 1)
         result = lhs.otimes(rhs)
         assert expect == tuple(int(i) for i in result.data.flatten())
+
+
+class TestOperators:
+
+    T = Tens((2, 3))
+
+    def test_embed(self):
+        e = self.T.embed(1)
+        assert tuple(e.data.shape) == (6, 3)
+        assert dense(e)[4].tolist() == [0, 1, 0]
+
+    def test_proj(self):
+        p = self.T.proj(1)
+        assert dense(p).sum(1).tolist() == [2, 2, 2]
+        assert self.T.proj(1) is p
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_backend(self, backend):
+        with Tensor.use(backend):
+            p = self.T.proj(1)
+            x = api(backend).asarray(np.ones((2, 3), dtype=np.float32))
+            assert sparse.backend(p.data) == backend
+            assert np.asarray(p(x).data).tolist() == [2, 2, 2]
+        assert sparse.backend(self.T.proj(1).data) == "numpy"
+
+    def test_cache(self):
+        cache = OperatorCache()
+        ops = [cache("e1", self.T._embed_, 1) for _ in range(3)]
+        assert ops[0] is ops[1] is ops[2]
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+        assert info.currbytes > 0
+
+    def test_eviction(self):
+        cache = OperatorCache(maxbytes=1)
+        cache("e0", self.T._embed_, 0)
+        cache("e1", self.T._embed_, 1)
+        info = cache.cache_info()
+        assert (info.evictions, info.currsize) == (1, 1)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_persist(self, tmp_path, backend):
+        with Tensor.use(backend):
+            e1 = OperatorCache(path=tmp_path)("e1", self.T._embed_, 1)
+        cache = OperatorCache(path=tmp_path)
+        loaded = cache("e1", self.T._embed_, 1)
+        assert cache.cache_info().loads == 1
+        assert type(loaded) is type(e1)
+        assert sparse.backend(loaded.data) == backend
+        assert dense(loaded).tolist() == dense(e1).tolist()
+
+
+class TestLinear:
+
+    T = Tens((2, 3))
+
+    def test_matvec(self):
+        p = self.T.proj(1)
+        x = np.ones((2, 3))
+        assert p(x).data.tolist() == [2, 2, 2]
+        assert "csr" in p._formats_
+
+    def test_call_dynamic(self):
+        p = self.T.proj(1)
+        x = self.T(np.ones((2, 3)))
+        assert p(x).data.tolist() == p(x).data.tolist() == [2, 2, 2]
+        assert _typing_hooks(type(p)._head_) == (True, True)
+        assert p._calls_ is None
+
+    def test_asformat(self):
+        e = self.T.embed(1)
+        csr = e.asformat("csr")
+        assert sparse.layout(csr) == "csr"
+        assert e.asformat("csr") is csr
+
+    @pytest.mark.parametrize("backend", ["numpy"] + ["torch"] * HAS_TORCH)
+    def test_csr(self, backend):
+        with Tensor.use(backend):
+            e = self.T.embed(1)
+            f = Linear((3,), (2, 3))(e.asformat("csr"))
+            x = api(backend).asarray(np.arange(3.0, dtype=np.float32))
+            assert f.layout == "csr"
+            assert f.t().layout == "csc"
+            assert np.asarray(f(x).data).tolist() == [[0, 1, 2], [0, 1, 2]]
+
+    def test_compose(self):
+        e, p = self.T.embed(1), self.T.proj(1)
+        pe = p @ e
+        assert pe.layout == "csr"
+        assert dense(pe).tolist() == (2 * np.eye(3)).tolist()
+        d = Linear((6,), (3,))(np.ones((3, 6)))
+        assert (d @ e).layout == "dense"
+        assert (d @ e).data.tolist() == [[2.0] * 3] * 3
+
+    @pytest.mark.skipif(not HAS_JAX, reason="jax is not installed")
+    def test_jit(self):
+        import jax
+
+        with Tensor.use("jax"):
+            e, p = self.T.embed(1), self.T.proj(1)
+            pe = p @ e
+            y = jax.jit(lambda x: pe(x).data)(jax.numpy.arange(3.0))
+        assert np.asarray(y).tolist() == [0, 2, 4]
+
+
+class TestOtimes:
+
+    rng = np.random.default_rng(0)
+    F = rng.standard_normal((3, 2)).astype(np.float32)
+    G = rng.standard_normal((4, 5)).astype(np.float32)
+    FG = np.kron(F, G)
+
+    def linears(self, backend, fmt="dense"):
+        F, G = (sparse.convert(api(backend).asarray(M), fmt) for M in (self.F, self.G))
+        return Linear((2,), (3,))(F), Linear((5,), (4,))(G)
+
+    def test_new(self):
+        assert Otimes(Tens((2,)), Tens((3,))).shape == (2, 3)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_lazy(self, backend):
+        fg = Otimes.fmap(*self.linears(backend))
+        assert fg.layout == "lazy"
+        x = self.rng.standard_normal((2, 5)).astype(np.float32)
+        y = np.asarray(fg(api(backend).asarray(x)).data)
+        assert y.shape == (3, 4)
+        assert np.allclose(y.reshape(-1), self.FG @ x.reshape(-1), atol=1e-5)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_batch(self, backend):
+        fg = Otimes.fmap(*self.linears(backend))
+        xs = self.rng.standard_normal((7, 2, 5)).astype(np.float32)
+        ys = np.asarray(fg(api(backend).asarray(xs)).data).reshape(7, -1)
+        assert np.allclose(ys, xs.reshape(7, -1) @ self.FG.T, atol=1e-5)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_materialize(self, backend):
+        fg = Otimes.fmap(*self.linears(backend)).materialize()
+        assert fg.layout == "dense"
+        assert np.allclose(dense(fg), self.FG)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_compose(self, backend):
+        fg = Otimes.fmap(*self.linears(backend))
+        gram = fg.t() @ fg
+        assert isinstance(gram.data, lazy.Kron)
+        assert np.allclose(dense(gram.materialize()), self.FG.T @ self.FG, atol=1e-4)
+        D = self.rng.standard_normal((6, 12)).astype(np.float32)
+        d = Linear((3, 4), (6,))(api(backend).asarray(D))
+        x = self.rng.standard_normal((2, 5)).astype(np.float32)
+        y = np.asarray((d @ fg)(api(backend).asarray(x)).data)
+        assert (d @ fg).layout == "lazy"
+        assert np.allclose(y, D @ self.FG @ x.reshape(-1), atol=1e-4)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_sparse(self, backend):
+        fg = Otimes.fmap(*self.linears(backend, "coo"))
+        assert fg.layout == "coo"
+        assert np.allclose(dense(fg), self.FG)
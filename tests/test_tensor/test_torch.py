@@ -1,3 +1,7 @@
+import pytest
+
+pytest.importorskip("torch")
+
 from _test_tensor import _TestTensor
 from fp.tensors import Torch
 
@@ -23,3 +23,21 @@ def test_substitute_prod():
 
 def test_match():
     assert List("A").match(List(List(Int)))["A"] == List(Int)
+
+
+def test_match_ellipsis():
+    match = Prod("A", ...).match(Prod(Int, Str, Str))
+    assert match["A"] == Int and match["..."] == (Str, Str)
+
+
+def test_match_conflict():
+    assert Prod("A", "A").match(Prod(Int, Str)) is None
+
+
+def test_match_memoized():
+    pattern = Prod("A", "B", "A")
+    m1 = pattern.match(Prod(Int, Str, Int))
+    m1["A"] = Str
+    m2 = pattern.match(Prod(Int, Str, Int))
+    assert m2["A"] == Int
+    assert Prod(Int, Str, Int) in pattern._matches_